@@ -3,27 +3,71 @@ Base database adapter for MCP server.
 """
 
 from abc import ABC, abstractmethod
-from typing import Dict, List, Any, Tuple, Optional
+from typing import Dict, List, Any, Tuple, Optional, Iterator
 import logging
 import os
+import re
+import threading
+from functools import lru_cache
+from cachetools import TTLCache
+
+from security.query_validator import QueryValidator, SecurityLevel
+from security.identifier_manager import IdentifierManager
 
 logger = logging.getLogger(__name__)
 
+# get_table_stats 통계 계산 방식
+STATS_MODES = ("auto", "exact", "approx")
+
+# 쓰기 허용 모드에서 실행 후 메타데이터 캐시를 무효화할 DDL 문
+_DDL_RE = re.compile(r'\s*(CREATE|ALTER|DROP|RENAME|TRUNCATE)\b', re.IGNORECASE)
+
+# get_table_stats 집계 쿼리 하나에 포함할 최대 컬럼 수
+STATS_COLUMNS_PER_QUERY = 50
+
+# 추정 행 수가 이 값을 넘으면 get_table_stats가 전체 스캔 대신 근사치를 사용
+STATS_SAMPLE_THRESHOLD = int(os.getenv("STATS_SAMPLE_THRESHOLD", "1000000"))
+STATS_SAMPLE_SIZE = int(os.getenv("STATS_SAMPLE_SIZE", "100000"))
+
+def _parse_bool_env(name: str, default: str = "true") -> bool:
+    """불리언 환경변수 파싱"""
+    return os.getenv(name, default).lower() == "true"
+
+@lru_cache(maxsize=None)
+def _get_shared_validator(security_level: SecurityLevel) -> QueryValidator:
+    """보안 수준별 공유 쿼리 검증기 (검증기는 상태가 없으므로 어댑터 간 공유)"""
+    return QueryValidator(security_level)
+
 class DatabaseAdapter(ABC):
     """데이터베이스 어댑터 베이스 클래스"""
     
+    # 환경변수 설정 (클래스 로드 시 한 번만 파싱, 변경 시 reload_env() 호출)
+    _READ_ONLY = _parse_bool_env("READ_ONLY")
+    _STRICT_READONLY = _parse_bool_env("STRICT_READONLY")
+    _SCHEMA_CACHE_TTL = int(os.getenv("SCHEMA_CACHE_TTL", "300"))
+    
     def __init__(self, config: dict):
         self.config = config
         self.connection = None
-        self.read_only = os.getenv("READ_ONLY", "true").lower() == "true"
-        self.strict_readonly = os.getenv("STRICT_READONLY", "true").lower() == "true"
+        self.read_only = self._READ_ONLY
+        self.strict_readonly = self._STRICT_READONLY
+        
+        # 보안 검증기 초기화 (검증기는 공유, 화이트리스트를 가진 식별자 관리자는 어댑터별)
+        self.validator = _get_shared_validator(SecurityLevel.STRICT if self.strict_readonly else SecurityLevel.NORMAL)
+        self.identifier_manager = IdentifierManager(
+            self.validator, schema_loader=self._load_identifier_cache, cache_ttl=self._SCHEMA_CACHE_TTL
+        )
         
-        # 보안 검증기 초기화
-        from security.query_validator import QueryValidator, SecurityLevel
-        from security.identifier_manager import IdentifierManager
+        # 메타데이터(테이블/스키마/외래키/인덱스) TTL 캐시
+        self._meta_cache = TTLCache(maxsize=1024, ttl=self._SCHEMA_CACHE_TTL)
+        self._meta_cache_lock = threading.Lock()
         
-        self.validator = QueryValidator(SecurityLevel.STRICT if self.strict_readonly else SecurityLevel.NORMAL)
-        self.identifier_manager = IdentifierManager(self.validator)
+    @classmethod
+    def reload_env(cls) -> None:
+        """환경변수 설정 다시 읽기 (이후 생성되는 어댑터부터 적용)"""
+        cls._READ_ONLY = _parse_bool_env("READ_ONLY")
+        cls._STRICT_READONLY = _parse_bool_env("STRICT_READONLY")
+        cls._SCHEMA_CACHE_TTL = int(os.getenv("SCHEMA_CACHE_TTL", "300"))
         
     @abstractmethod
     def connect(self):
@@ -36,10 +80,20 @@ class DatabaseAdapter(ABC):
         pass
         
     @abstractmethod
-    def execute_query(self, query: str, params: tuple = None) -> List[Dict]:
-        """쿼리 실행 (SELECT)"""
+    def execute_query(self, query: str, params: tuple = None, max_rows: int = None) -> List[Dict]:
+        """쿼리 실행 (SELECT). max_rows가 주어지면 최대 max_rows개 행만 가져옴"""
         pass
         
+    def execute_query_iter(self, query: str, params: tuple = None, max_rows: int = None) -> Iterator[Dict]:
+        """쿼리 실행 결과를 행 단위 이터레이터로 반환 (스트리밍 지원 어댑터는 재정의)"""
+        return iter(self.execute_query(query, params, max_rows))
+        
+    def execute_query_with_columns(self, query: str, params: tuple = None,
+                                   max_rows: int = None) -> Tuple[List[str], List[Dict]]:
+        """쿼리 실행 결과와 컬럼명 목록을 함께 반환 (커서 메타데이터 지원 어댑터는 재정의)"""
+        rows = self.execute_query(query, params, max_rows)
+        return (list(rows[0].keys()) if rows else []), rows
+        
     @abstractmethod
     def get_tables(self) -> List[str]:
         """테이블 목록 조회"""
@@ -55,9 +109,92 @@ class DatabaseAdapter(ABC):
         """외래키 정보 조회"""
         pass
         
+    def get_table_schema_bulk(self, tables: List[str] = None) -> Dict[str, List[Dict]]:
+        """여러 테이블의 스키마 일괄 조회 (단일 쿼리 지원 어댑터는 재정의)
+        
+        Args:
+            tables: 조회할 테이블 목록. None이면 전체 테이블
+            
+        Returns:
+            {테이블명: 컬럼 정보 목록}
+        """
+        if tables is None:
+            tables = self.get_tables()
+        return {table: self.get_table_schema(table) for table in tables}
+        
+    def get_foreign_keys_bulk(self, tables: List[str] = None) -> Dict[str, List[Dict]]:
+        """여러 테이블의 외래키 일괄 조회 (단일 쿼리 지원 어댑터는 재정의)
+        
+        Args:
+            tables: 조회할 테이블 목록. None이면 전체 테이블
+            
+        Returns:
+            {테이블명: 외래키 정보 목록}
+        """
+        if tables is None:
+            tables = self.get_tables()
+        return {table: self.get_foreign_keys(table) for table in tables}
+        
+    def get_indexes_bulk(self, tables: List[str] = None) -> Dict[str, Dict]:
+        """여러 테이블의 인덱스 일괄 조회 (전체 조회가 테이블별 조회와 동일한 어댑터는 재정의)
+        
+        Args:
+            tables: 조회할 테이블 목록. None이면 전체 테이블
+            
+        Returns:
+            {테이블명: {인덱스명: 인덱스 정보}}
+        """
+        if tables is None:
+            tables = self.get_tables()
+        return {table: self.get_indexes(table).get(table, {}) for table in tables}
+        
+    def get_table_metadata(self, table_name: str) -> Dict:
+        """단일 테이블의 크기/인덱스/외래키 정보 조회 (단일 쿼리 지원 어댑터는 재정의)
+        
+        Returns:
+            {"size": {...}, "indexes": {...}, "foreign_keys": [...]}
+        """
+        return {
+            "size": self.get_table_size(table_name),
+            "indexes": self.get_indexes(table_name).get(table_name, {}),
+            "foreign_keys": self.get_foreign_keys(table_name)
+        }
+        
+    def get_all_tables_metadata(self, tables: List[str] = None) -> Dict[str, Dict]:
+        """여러 테이블의 컬럼/외래키/인덱스 정보 일괄 조회
+        
+        테이블별로 메타데이터 쿼리를 반복하지 않고 종류별 일괄 조회로 처리합니다.
+        
+        Args:
+            tables: 조회할 테이블 목록. None이면 전체 테이블
+            
+        Returns:
+            {테이블명: {"columns": [...], "foreign_keys": [...], "indexes": {...}}}
+        """
+        if tables is None:
+            tables = self.get_tables()
+            
+        schemas = self.get_table_schema_bulk(tables)
+        foreign_keys = self.get_foreign_keys_bulk(tables)
+        indexes = self.get_indexes_bulk(tables)
+        
+        return {
+            table: {
+                "columns": schemas.get(table, []),
+                "foreign_keys": foreign_keys.get(table, []),
+                "indexes": indexes.get(table, {})
+            } for table in tables
+        }
+        
     @abstractmethod
-    def get_table_stats(self, table_name: str) -> Dict:
-        """테이블 통계 정보"""
+    def get_table_stats(self, table_name: str, stats_mode: str = "auto", columns: List[str] = None) -> Dict:
+        """테이블 통계 정보
+        
+        Args:
+            stats_mode: "exact"(전체 스캔), "approx"(메타데이터/샘플 기반 근사),
+                        "auto"(대용량 테이블만 근사)
+            columns: 통계를 계산할 컬럼 목록. None이면 전체 컬럼
+        """
         pass
         
     @abstractmethod
@@ -65,18 +202,31 @@ class DatabaseAdapter(ABC):
         """테이블 크기 정보"""
         pass
         
+    def get_table_sizes_bulk(self, tables: List[str] = None) -> Dict[str, Dict]:
+        """여러 테이블의 크기 정보 일괄 조회 (단일 쿼리 지원 어댑터는 재정의)
+        
+        Args:
+            tables: 조회할 테이블 목록. None이면 전체 테이블
+            
+        Returns:
+            {테이블명: 크기 정보} (정보가 없는 테이블은 빈 딕셔너리)
+        """
+        if tables is None:
+            tables = self.get_tables()
+        return {table: self.get_table_size(table) for table in tables}
+        
     @abstractmethod
     def get_indexes(self, table_name: str = None) -> Dict:
         """인덱스 정보"""
         pass
         
     @abstractmethod
-    def explain_query(self, query: str) -> Dict:
-        """쿼리 실행 계획"""
+    def explain_query(self, query: str, analyze: bool = False) -> Dict:
+        """쿼리 실행 계획 (analyze=True이면 실제 실행 통계 포함, 지원 DB만)"""
         pass
         
     @abstractmethod
-    def get_db_status(self) -> Dict:
+    def get_db_status(self, include_processes: bool = False) -> Dict:
         """데이터베이스 상태 정보"""
         pass
         
@@ -95,19 +245,16 @@ class DatabaseAdapter(ABC):
             # 1. 테이블명 검증
             self.identifier_manager.validate_table_name(table_name)
             
-            # 2. 컬럼 정보 먼저 조회
-            schema = self.get_table_schema(table_name)
-            columns = [col['name'] for col in schema]
-            
-            # 3. 안전한 쿼리 구성 (파라미터 바인딩 사용)
+            # 2. 안전한 쿼리 구성 (파라미터 바인딩 사용)
             safe_table_name = self.identifier_manager.get_safe_identifier(table_name, self.get_db_type())
             query = f"SELECT * FROM {safe_table_name} LIMIT %s"
             
-            # 4. 쿼리 검증
+            # 3. 쿼리 검증
             self.validator.validate_query(query, self.get_db_type())
             
-            # 5. 파라미터 바인딩으로 실행
-            rows = self.execute_query(query, (limit,))
+            # 4. 파라미터 바인딩으로 실행 (컬럼 목록은 결과 메타데이터에서 추출하여
+            #    별도의 스키마 조회 라운드트립 생략)
+            columns, rows = self.execute_query_with_columns(query, (limit,))
             
             return {
                 "table_name": table_name,
@@ -118,6 +265,85 @@ class DatabaseAdapter(ABC):
             logger.error(f"샘플 데이터 조회 중 오류 발생: {str(e)}")
             raise
             
+    def _get_cached_metadata(self, key: tuple, loader):
+        """메타데이터 캐시 조회 (캐시에 없으면 loader 실행 후 저장)"""
+        with self._meta_cache_lock:
+            if key in self._meta_cache:
+                return self._meta_cache[key]
+                
+        value = loader()
+        
+        with self._meta_cache_lock:
+            self._meta_cache[key] = value
+        return value
+        
+    def _get_cached_metadata_bulk(self, name: str, tables: List[str], loader) -> Dict[str, Any]:
+        """테이블별 메타데이터 일괄 캐시 조회
+        
+        캐시에 없는 테이블만 모아 loader(missing_tables)를 한 번 호출하고,
+        결과를 테이블별 캐시 키 (name, table)에 저장합니다.
+        """
+        results = {}
+        missing = []
+        with self._meta_cache_lock:
+            for table in tables:
+                key = (name, table)
+                if key in self._meta_cache:
+                    results[table] = self._meta_cache[key]
+                else:
+                    missing.append(table)
+                    
+        if missing:
+            loaded = loader(missing)
+            with self._meta_cache_lock:
+                for table in missing:
+                    value = loaded.get(table, [])
+                    self._meta_cache[(name, table)] = value
+                    results[table] = value
+                    
+        return {table: results[table] for table in tables}
+        
+    def invalidate_schema_cache(self, table_name: str = None) -> None:
+        """메타데이터 캐시 무효화 (DDL 실행 후 호출)
+        
+        Args:
+            table_name: 무효화할 테이블명. None이면 전체 캐시 무효화
+        """
+        with self._meta_cache_lock:
+            if table_name is None:
+                self._meta_cache.clear()
+                return
+                
+            # 해당 테이블 항목과 전체 테이블 대상 항목(테이블 목록 등) 제거
+            for key in list(self._meta_cache.keys()):
+                if key[1] in (table_name, None):
+                    self._meta_cache.pop(key, None)
+                    
+    def _invalidate_after_ddl(self, query: str) -> None:
+        """쓰기 허용 모드에서 DDL 실행 후 메타데이터 캐시와 식별자 화이트리스트 무효화 (다음 조회 시 재로딩)"""
+        if not self.read_only and _DDL_RE.match(query):
+            self.invalidate_schema_cache()
+            self.identifier_manager.invalidate_cache()
+            
+    def refresh_schema_cache(self) -> None:
+        """메타데이터 캐시와 식별자 화이트리스트를 비우고 다시 로드 (DDL 실행 후 호출)"""
+        self.invalidate_schema_cache()
+        self.identifier_manager.invalidate_cache()
+        self._load_identifier_cache()
+        
+    def _load_identifier_cache(self) -> None:
+        """식별자 화이트리스트 로드 (연결이 없으면 임시로 연결)"""
+        # 테이블 목록은 새로 조회해 화이트리스트가 get_tables 캐시보다 오래된 상태로 남지 않도록 함
+        with self._meta_cache_lock:
+            self._meta_cache.pop(("get_tables", None), None)
+            
+        if self.connection is not None:
+            self.identifier_manager.load_schema_cache(self)
+            return
+            
+        with self:
+            self.identifier_manager.load_schema_cache(self)
+            
     def get_db_type(self) -> str:
         """데이터베이스 타입 반환"""
         return self.config.get('db_type', 'mysql').lower()
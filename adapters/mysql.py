@@ -3,170 +3,390 @@ MySQL/MariaDB adapter for MCP server.
 """
 
 import pymysql
+import pymysql.cursors
+import json
 import logging
-from typing import Dict, List, Any
-from .base import DatabaseAdapter
+import os
+import sys
+import threading
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+from typing import Dict, List, Any, Iterator, Tuple
+from dbutils.pooled_db import PooledDB
+from cachetools import TTLCache
+from .base import (
+    DatabaseAdapter, STATS_MODES, STATS_COLUMNS_PER_QUERY, STATS_SAMPLE_THRESHOLD, STATS_SAMPLE_SIZE
+)
+from security.identifier_manager import quote_identifier
 
 logger = logging.getLogger(__name__)
 
+# get_db_status에서 조회하는 서버 상태/변수 키
+_STATUS_KEYS = ('Questions', 'Slow_queries', 'Threads_connected', 'Threads_running', 'Bytes_received', 'Bytes_sent')
+_VARIABLE_KEYS = ('max_connections', 'version', 'character_set_server', 'collation_server')
+
+# 스키마/외래키 조회 결과 딕셔너리 키
+_SCHEMA_FIELDS = ('name', 'type', 'nullable', 'key', 'default', 'extra')
+_FK_FIELDS = ('column', 'referenced_table', 'referenced_column')
+
+# SHOW PROCESSLIST 결과 컬럼 순서에 대응하는 응답 키
+_PROCESSLIST_KEYS = ('id', 'user', 'host', 'db', 'command', 'time', 'state', 'info')
+
+# get_db_status의 서버 변수(max_connections, version 등) 캐시 유지 시간 (초)
+SERVER_VARIABLES_CACHE_TTL = 60
+
+# explain_query 상태 증분 계산용 세션 상태 키 (performance_schema 미지원 시)
+_HANDLER_STATUS_KEYS = (
+    "Handler_read_first", "Handler_read_key", "Handler_read_next",
+    "Handler_read_rnd", "Handler_read_rnd_next",
+    "Created_tmp_tables", "Sort_rows"
+)
+
+# 연결 설정별 커넥션 풀 (프로세스 전역 공유)
+# pymysql.connect에 전달하지 않는 어댑터 전용 설정 키
+_ADAPTER_OPTION_KEYS = ('pool_size', 'max_connections', 'status_fanout')
+
+# get_db_status 동시 실행에 필요한 최소 풀 최대 연결 수 (현재 연결 + 동시 조회 연결)
+STATUS_FANOUT_MIN_CONNECTIONS = 4
+
+_POOLS: Dict[tuple, PooledDB] = {}
+_POOLS_LOCK = threading.Lock()
+
+# SQL 모드 설정 (엄격 모드) - 필수 세션 설정
+_SQL_MODE_ASSIGNMENT = "sql_mode = 'STRICT_TRANS_TABLES,NO_ZERO_DATE,NO_ZERO_IN_DATE,ERROR_FOR_DIVISION_BY_ZERO'"
+
+# information_schema 테이블 통계 캐시 유지 시간 (초, MySQL 8.0+).
+# 서버 기본값(86400)과 같으면 효과가 없으므로 환경 변수로 지정한 경우에만 세션에 적용
+_STATS_EXPIRY_ENV = os.getenv("INFORMATION_SCHEMA_STATS_EXPIRY")
+INFORMATION_SCHEMA_STATS_EXPIRY = int(_STATS_EXPIRY_ENV) if _STATS_EXPIRY_ENV else None
+
+# 권한/버전에 따라 실패할 수 있는 세션 설정 (실패해도 무시)
+# 참고: innodb_stats_on_metadata는 GLOBAL 전용 변수라 세션에서 설정할 수 없음 (서버 설정, 5.6.6부터 기본값 OFF)
+_OPTIONAL_SESSION_ASSIGNMENTS = (
+    "local_infile = 0",  # Local infile 비활성화 (세션 단위)
+    "sql_log_bin = 0",   # 바이너리 로그 비활성화 (세션)
+)
+if INFORMATION_SCHEMA_STATS_EXPIRY is not None:
+    _OPTIONAL_SESSION_ASSIGNMENTS += (f"information_schema_stats_expiry = {INFORMATION_SCHEMA_STATS_EXPIRY}",)
+# 한 번 실패한 설정은 이후 물리 연결에서 다시 시도하지 않음
+_UNSUPPORTED_SESSION_ASSIGNMENTS = set()
+
+class _InternedSSDictCursor(pymysql.cursors.SSDictCursor):
+    """컬럼명을 sys.intern으로 공유하는 서버 측 딕셔너리 커서
+    
+    같은 컬럼명이 여러 쿼리 결과(및 캐시된 응답)에 반복될 때
+    행 딕셔너리들이 동일한 키 문자열 객체를 참조하도록 합니다.
+    """
+    
+    def _do_get_result(self):
+        super()._do_get_result()
+        if self.description:
+            self._fields = [sys.intern(name) for name in self._fields]
+
+def _create_secure_connection(**secure_config):
+    """풀에 새 물리 연결을 추가할 때 호출되는 생성 함수 (세션 보안 설정 포함)"""
+    connection = pymysql.connect(**secure_config)
+    
+    # 추가 보안 설정 - 물리 연결당 한 번, 단일 SET 문으로 적용
+    assignments = [_SQL_MODE_ASSIGNMENT] + [
+        assignment for assignment in _OPTIONAL_SESSION_ASSIGNMENTS
+        if assignment not in _UNSUPPORTED_SESSION_ASSIGNMENTS
+    ]
+    with connection.cursor() as cursor:
+        try:
+            cursor.execute(f"SET SESSION {', '.join(assignments)}")
+        except Exception:
+            if len(assignments) == 1:
+                raise
+                
+            # 선택 설정 중 실패한 항목을 찾아 기록 (SQL 모드 실패는 그대로 전파)
+            cursor.execute(f"SET SESSION {_SQL_MODE_ASSIGNMENT}")
+            for assignment in assignments[1:]:
+                try:
+                    cursor.execute(f"SET SESSION {assignment}")
+                except Exception:
+                    _UNSUPPORTED_SESSION_ASSIGNMENTS.add(assignment)
+                    
+    return connection
+
+def _get_pool(secure_config: dict, key: tuple, pool_size: int, max_connections: int) -> PooledDB:
+    """연결 설정에 해당하는 커넥션 풀 반환 (없으면 생성)"""
+    with _POOLS_LOCK:
+        pool = _POOLS.get(key)
+        if pool is None:
+            pool = PooledDB(
+                creator=_create_secure_connection,
+                mincached=min(2, pool_size),
+                maxcached=pool_size,
+                maxconnections=max_connections,
+                blocking=True,
+                # 풀에서 꺼낼 때마다 ping하여 서버가 끊은 유휴 연결은 재연결
+                ping=1,
+                **secure_config
+            )
+            _POOLS[key] = pool
+        return pool
+
 class MySQLAdapter(DatabaseAdapter):
     """MySQL/MariaDB 어댑터"""
     
     def __init__(self, config: dict):
         super().__init__(config)
         
-    def connect(self):
-        """MySQL 데이터베이스 연결 (보안 강화)"""
-        try:
-            # 보안 강화된 연결 설정
-            secure_config = self.config.copy()
-            
+        # 커넥션 풀 크기 (config 값 우선, 없으면 환경변수)
+        self._pool_size = int(config.get('pool_size', os.getenv("CONNECTION_POOL_SIZE", "5")))
+        self._max_connections = int(config.get('max_connections', os.getenv("MAX_CONNECTIONS", "10")))
+        
+        # get_db_status 독립 조회를 풀의 여러 연결로 동시 실행할지 여부
+        # (포화된 풀에서 연결을 추가로 점유하지 않도록 기본값은 비활성화)
+        self._status_fanout = str(config.get('status_fanout', os.getenv("STATUS_FANOUT", "false"))).lower() == "true"
+        
+        # 보안 강화된 연결 설정 (연결마다 복사하지 않도록 한 번만 구성)
+        self._secure_config = {
+            **{k: v for k, v in config.items() if k not in _ADAPTER_OPTION_KEYS},
             # Local infile 비활성화 (보안)
-            secure_config['local_infile'] = False
-            
+            'local_infile': False,
             # 연결 타임아웃 설정
-            secure_config['connect_timeout'] = 10
-            secure_config['read_timeout'] = 30
-            secure_config['write_timeout'] = 30
-            
-            self.connection = pymysql.connect(**secure_config)
-            
-            # 추가 보안 설정
-            with self.connection.cursor() as cursor:
-                # SQL 모드 설정 (엄격 모드)
-                cursor.execute("SET sql_mode = 'STRICT_TRANS_TABLES,NO_ZERO_DATE,NO_ZERO_IN_DATE,ERROR_FOR_DIVISION_BY_ZERO'")
-                
-                # Local infile 비활성화 (세션 단위). 권한 부족 시 무시
-                try:
-                    cursor.execute("SET SESSION local_infile = 0")
-                except Exception:
-                    pass
-                
-                # 보안 관련 변수 설정 (권한 없을 수 있음) - 실패해도 무시
-                try:
-                    cursor.execute("SET SESSION sql_log_bin = 0")  # 바이너리 로그 비활성화 (세션)
-                except Exception:
-                    pass
+            'connect_timeout': 10,
+            'read_timeout': 30,
+            'write_timeout': 30,
+            # 메타데이터 조회는 튜플 인덱싱에 의존하므로 기본 커서는 튜플 커서로 고정
+            # (딕셔너리 행이 필요한 execute_query 계열은 DictCursor를 명시적으로 사용)
+            'cursorclass': pymysql.cursors.Cursor
+        }
+        self._pool_key = (frozenset(self._secure_config.items()), self._pool_size, self._max_connections)
+        
+        # get_db_status 서버 변수 캐시
+        self._server_variables_cache = TTLCache(maxsize=1, ttl=SERVER_VARIABLES_CACHE_TTL)
+        
+        # 전체 인덱스 조회에 JSON 집계 사용 여부 (미지원 서버는 행 단위 조회로 전환)
+        self._use_json_index_aggregation = True
+        
+        # 서버 버전 문자열 (EXPLAIN ANALYZE 지원 여부 판단용, 최초 사용 시 조회)
+        self._server_version = None
+        
+        # explain_query 통계에 performance_schema 문장 이력 사용 여부
+        # (None: 미확인, 조회 실패/이력 없음이면 False로 두고 상태 증분 방식으로 전환)
+        self._use_statement_history = None
+        
+    def connect(self):
+        """MySQL 데이터베이스 연결 (보안 강화, 커넥션 풀 사용)"""
+        try:
+            # 풀에서 연결 획득 (TCP/인증 핸드셰이크는 새 물리 연결에서만 발생)
+            self.connection = _get_pool(
+                self._secure_config, self._pool_key, self._pool_size, self._max_connections
+            ).connection()
                 
             logger.info("MySQL 데이터베이스 연결 성공 (보안 강화)")
             
-            # 스키마 캐시 로드
-            self.identifier_manager.load_schema_cache(self)
-            
         except Exception as e:
             logger.error(f"MySQL 연결 실패: {str(e)}")
             raise
             
     def disconnect(self):
-        """MySQL 데이터베이스 연결 해제"""
+        """MySQL 데이터베이스 연결 해제 (풀에 반납)"""
         if self.connection:
             self.connection.close()
             self.connection = None
             
     def _quote_identifier(self, identifier: str) -> str:
         """MySQL 식별자 인용부호 처리"""
-        return f"`{identifier}`"
+        return quote_identifier(identifier, "mysql")
         
-    def execute_query(self, query: str, params: tuple = None) -> List[Dict]:
+    def execute_query(self, query: str, params: tuple = None, max_rows: int = None) -> List[Dict]:
         """MySQL 쿼리 실행 (보안 강화)"""
+        return list(self.execute_query_iter(query, params, max_rows))
+        
+    def execute_query_iter(self, query: str, params: tuple = None, max_rows: int = None) -> Iterator[Dict]:
+        """MySQL 쿼리 실행 - 서버 측 커서로 결과를 한 행씩 스트리밍 (보안 강화)"""
+        try:
+            # 1. 읽기 전용 모드 검증 (이터레이터 생성 시점에 즉시 수행)
+            if self.read_only:
+                self.validator.validate_query(query, "mysql")
+        except Exception as e:
+            logger.error(f"쿼리 실행 실패: {str(e)}")
+            raise
+            
+        return self._stream_query(query, params, max_rows)
+        
+    def execute_query_with_columns(self, query: str, params: tuple = None,
+                                   max_rows: int = None) -> Tuple[List[str], List[Dict]]:
+        """MySQL 쿼리 실행 결과와 컬럼명 목록 반환 (빈 결과도 컬럼 정보 포함)"""
         try:
             # 1. 읽기 전용 모드 검증
             if self.read_only:
                 self.validator.validate_query(query, "mysql")
             
-            # 2. 쿼리 실행
-            with self.connection.cursor() as cursor:
+            # 2. 쿼리 실행 - 컬럼명은 커서 메타데이터(행 딕셔너리 키와 동일)에서 추출
+            with self.connection.cursor(_InternedSSDictCursor) as cursor:
+                cursor.execute(query, params or ())
+                self._invalidate_after_ddl(query)
+                
+                if not cursor.description:
+                    return [], []
+                return list(cursor._fields), list(islice(cursor, max_rows))
+                
+        except Exception as e:
+            logger.error(f"쿼리 실행 실패: {str(e)}")
+            raise
+            
+    def _stream_query(self, query: str, params: tuple = None, max_rows: int = None) -> Iterator[Dict]:
+        """서버 측 딕셔너리 커서로 결과를 버퍼링 없이 딕셔너리 행으로 반환 (max_rows개에서 중단)"""
+        try:
+            # 2. 쿼리 실행 (행은 pymysql 커서에서 바로 dict로 생성됨)
+            with self.connection.cursor(_InternedSSDictCursor) as cursor:
                 cursor.execute(query, params or ())
+                self._invalidate_after_ddl(query)
                 
-                # 결과가 있는 경우에만 컬럼 정보 추출
+                # 결과가 있는 경우에만 행 반환
                 if cursor.description:
-                    columns = [desc[0] for desc in cursor.description]
-                    rows = cursor.fetchall()
-                    return [dict(zip(columns, row)) for row in rows]
-                else:
-                    return []
+                    yield from islice(cursor, max_rows)
                     
         except Exception as e:
             logger.error(f"쿼리 실행 실패: {str(e)}")
             raise
             
     def get_tables(self) -> List[str]:
+        """테이블 목록 조회 (캐시 사용)"""
+        return self._get_cached_metadata(("get_tables", None), self._fetch_tables)
+        
+    def _fetch_tables(self) -> List[str]:
         """테이블 목록 조회"""
         with self.connection.cursor() as cursor:
             cursor.execute("SHOW TABLES")
             return [row[0] for row in cursor.fetchall()]
             
     def get_table_schema(self, table_name: str) -> List[Dict]:
-        """테이블 스키마 조회"""
-        with self.connection.cursor() as cursor:
-            cursor.execute(f"DESCRIBE `{table_name}`")
-            columns = cursor.fetchall()
-            
-            return [
-                {
-                    "name": col[0],
-                    "type": col[1],
-                    "nullable": col[2] == "YES",
-                    "key": col[3],
-                    "default": col[4],
-                    "extra": col[5]
-                } for col in columns
-            ]
-            
+        """테이블 스키마 조회 (캐시 사용)"""
+        return self._get_cached_metadata(
+            ("get_table_schema", table_name),
+            lambda: self._fetch_table_schema(table_name)
+        )
+        
+    def _fetch_table_schema(self, table_name: str) -> List[Dict]:
+        """테이블 스키마 조회 (DESCRIBE 대신 파라미터 바인딩된 INFORMATION_SCHEMA.COLUMNS 조회)"""
+        return self._fetch_table_schema_bulk([table_name]).get(table_name, [])
+        
     def get_foreign_keys(self, table_name: str) -> List[Dict]:
+        """외래키 정보 조회 (캐시 사용)"""
+        return self._get_cached_metadata(
+            ("get_foreign_keys", table_name),
+            lambda: self._fetch_foreign_keys(table_name)
+        )
+        
+    def _fetch_foreign_keys(self, table_name: str) -> List[Dict]:
         """외래키 정보 조회"""
+        return self._fetch_foreign_keys_bulk([table_name]).get(table_name, [])
+        
+    def get_table_schema_bulk(self, tables: List[str] = None) -> Dict[str, List[Dict]]:
+        """여러 테이블의 스키마 일괄 조회 (캐시 사용, 미캐시 테이블은 단일 쿼리)"""
+        if tables is None:
+            tables = self.get_tables()
+        return self._get_cached_metadata_bulk("get_table_schema", tables, self._fetch_table_schema_bulk)
+        
+    def _fetch_table_schema_bulk(self, tables: List[str]) -> Dict[str, List[Dict]]:
+        """INFORMATION_SCHEMA.COLUMNS 한 번 조회로 여러 테이블 스키마 조회"""
+        schemas = defaultdict(list)
+        placeholders = ", ".join(["%s"] * len(tables))
         with self.connection.cursor() as cursor:
-            cursor.execute("""
-                SELECT COLUMN_NAME, REFERENCED_TABLE_NAME, REFERENCED_COLUMN_NAME
-                FROM INFORMATION_SCHEMA.KEY_COLUMN_USAGE
-                WHERE TABLE_SCHEMA = %s AND TABLE_NAME = %s AND REFERENCED_TABLE_NAME IS NOT NULL
-            """, (self.config["db"], table_name))
+            cursor.execute(f"""
+                SELECT TABLE_NAME, COLUMN_NAME, COLUMN_TYPE, IS_NULLABLE,
+                       COLUMN_KEY, COLUMN_DEFAULT, EXTRA
+                FROM INFORMATION_SCHEMA.COLUMNS
+                WHERE TABLE_SCHEMA = %s AND TABLE_NAME IN ({placeholders})
+                ORDER BY TABLE_NAME, ORDINAL_POSITION
+            """, (self.config["db"], *tables))
             
-            foreign_keys = cursor.fetchall()
-            return [
-                {
-                    "column": fk[0],
-                    "referenced_table": fk[1],
-                    "referenced_column": fk[2]
-                } for fk in foreign_keys
-            ]
+            for col in cursor.fetchall():
+                schemas[col[0]].append(dict(zip(
+                    _SCHEMA_FIELDS, (col[1], col[2], col[3] == "YES", col[4], col[5], col[6])
+                )))
+        return schemas
+        
+    def get_foreign_keys_bulk(self, tables: List[str] = None) -> Dict[str, List[Dict]]:
+        """여러 테이블의 외래키 일괄 조회 (캐시 사용, 미캐시 테이블은 단일 쿼리)"""
+        if tables is None:
+            tables = self.get_tables()
+        return self._get_cached_metadata_bulk("get_foreign_keys", tables, self._fetch_foreign_keys_bulk)
+        
+    def _fetch_foreign_keys_bulk(self, tables: List[str]) -> Dict[str, List[Dict]]:
+        """INFORMATION_SCHEMA.KEY_COLUMN_USAGE 한 번 조회로 여러 테이블 외래키 조회"""
+        foreign_keys = defaultdict(list)
+        placeholders = ", ".join(["%s"] * len(tables))
+        with self.connection.cursor() as cursor:
+            cursor.execute(f"""
+                SELECT TABLE_NAME, COLUMN_NAME, REFERENCED_TABLE_NAME, REFERENCED_COLUMN_NAME
+                FROM INFORMATION_SCHEMA.KEY_COLUMN_USAGE
+                WHERE CONSTRAINT_SCHEMA = %s AND TABLE_SCHEMA = %s
+                    AND REFERENCED_TABLE_NAME IS NOT NULL AND TABLE_NAME IN ({placeholders})
+            """, (self.config["db"], self.config["db"], *tables))
             
-    def get_table_stats(self, table_name: str) -> Dict:
-        """테이블 통계 정보 (보안 강화)"""
+            for fk in cursor.fetchall():
+                foreign_keys[fk[0]].append(dict(zip(_FK_FIELDS, fk[1:])))
+        return foreign_keys
+        
+    def get_table_stats(self, table_name: str, stats_mode: str = "auto", columns: List[str] = None) -> Dict:
+        """테이블 통계 정보 (보안 강화)
+        
+        Args:
+            stats_mode: "exact"(전체 스캔), "approx"(InnoDB 추정 행 수/인덱스 카디널리티/샘플),
+                        "auto"(추정 행 수가 STATS_SAMPLE_THRESHOLD를 넘을 때만 근사)
+            columns: 통계를 계산할 컬럼 목록. None이면 전체 컬럼
+        """
         try:
             # 1. 테이블명 검증
             self.identifier_manager.validate_table_name(table_name)
+            if stats_mode not in STATS_MODES:
+                raise ValueError(f"지원하지 않는 통계 방식입니다: {stats_mode} (허용: {', '.join(STATS_MODES)})")
             
             with self.connection.cursor() as cursor:
                 # 2. 안전한 테이블명 사용
                 safe_table_name = self.identifier_manager.get_safe_identifier(table_name, "mysql")
                 
-                # 3. 전체 행 수 조회 (파라미터 바인딩)
-                cursor.execute(f"SELECT COUNT(*) FROM {safe_table_name}")
-                total_rows = cursor.fetchone()[0]
+                # 3. 컬럼 목록 조회 및 검증
+                table_schema = self.get_table_schema(table_name)
+                if columns is None:
+                    columns = [col['name'] for col in table_schema]
+                col_names = list(columns)
+                self.identifier_manager.validate_column_names(table_name, col_names)
                 
-                # 4. 컬럼별 통계
-                schema = self.get_table_schema(table_name)
-                column_stats = {}
+                # NOT NULL 컬럼은 NULL 수 집계 생략
+                not_null = {col['name'] for col in table_schema if not col['nullable']}
                 
-                for col in schema:
-                    col_name = col['name']
-                    
-                    # 컬럼명 검증
-                    self.identifier_manager.validate_column_name(table_name, col_name)
-                    safe_col_name = self.identifier_manager.get_safe_identifier(col_name, "mysql")
-                    
-                    # NULL 값 비율 (파라미터 바인딩)
-                    cursor.execute(f"SELECT COUNT(*) FROM {safe_table_name} WHERE {safe_col_name} IS NULL")
-                    null_count = cursor.fetchone()[0]
+                # 4. 대용량 테이블은 전체 스캔 대신 근사치 사용
+                # (exact는 메타데이터가 필요 없으므로 조회 생략, 그 외에는 크기/인덱스 통계를 한 번에 가져옴)
+                if stats_mode == "exact":
+                    approximate = False
+                else:
+                    metadata = self.get_table_metadata(table_name)
+                    estimated_rows = metadata["size"].get("rows", 0)
+                    approximate = stats_mode == "approx" or estimated_rows > STATS_SAMPLE_THRESHOLD
+                
+                if approximate:
+                    # 행 수는 InnoDB 추정치, NULL 비율은 샘플 기준,
+                    # 고유값 수는 인덱스 카디널리티(없으면 샘플 기준)를 사용
+                    sample_rows, sampled = self._aggregate_column_stats(
+                        cursor, safe_table_name, col_names, sample_size=STATS_SAMPLE_SIZE, not_null=not_null
+                    )
+                    # 샘플이 테이블 전체를 덮었다면 샘플 행 수가 정확한 행 수
+                    total_rows = sample_rows if sample_rows < STATS_SAMPLE_SIZE else estimated_rows
+                    cardinality = self._get_column_cardinality(metadata["indexes"])
+                    aggregated = {}
+                    for col_name, (null_count, unique_count) in sampled.items():
+                        if sample_rows:
+                            null_count = round(null_count / sample_rows * total_rows)
+                        aggregated[col_name] = (null_count, cardinality.get(col_name, unique_count))
+                else:
+                    total_rows, aggregated = self._aggregate_column_stats(
+                        cursor, safe_table_name, col_names, not_null=not_null
+                    )
+                
+                column_stats = {}
+                for col_name, (null_count, unique_count) in aggregated.items():
                     null_ratio = (null_count / total_rows * 100) if total_rows > 0 else 0
                     
-                    # 고유값 수 (파라미터 바인딩)
-                    cursor.execute(f"SELECT COUNT(DISTINCT {safe_col_name}) FROM {safe_table_name}")
-                    unique_count = cursor.fetchone()[0]
-                    
                     column_stats[col_name] = {
-                        "total_rows": total_rows,
                         "null_count": null_count,
                         "null_ratio": round(null_ratio, 2),
                         "unique_values": unique_count
@@ -175,38 +395,187 @@ class MySQLAdapter(DatabaseAdapter):
                 return {
                     "table_name": table_name,
                     "total_rows": total_rows,
-                    "column_stats": column_stats
+                    "column_stats": column_stats,
+                    "unique_values_approx": approximate
                 }
         except Exception as e:
             logger.error(f"테이블 통계 조회 실패: {str(e)}")
             raise
             
+    def _aggregate_column_stats(self, cursor, safe_table_name: str, col_names: List[str],
+                                sample_size: int = None, not_null: set = frozenset()):
+        """전체 행 수와 컬럼별 NULL 수/고유값 수를 집계 쿼리로 조회
+        
+        컬럼마다 2번씩 쿼리하는 대신 테이블을 한 번만 스캔하며,
+        SELECT 표현식 수 제한을 피하기 위해 컬럼을 묶음 단위로 처리합니다.
+        sample_size가 주어지면 앞쪽 sample_size개 행만 집계하며,
+        not_null에 포함된 컬럼은 NULL 수를 0으로 두고 집계하지 않습니다.
+        
+        Returns:
+            (행 수, {컬럼명: (null_count, unique_count)})
+        """
+        row_count = None
+        results = {}
+        chunks = [col_names[i:i + STATS_COLUMNS_PER_QUERY]
+                  for i in range(0, len(col_names), STATS_COLUMNS_PER_QUERY)] or [[]]
+        
+        for chunk in chunks:
+            safe_cols = [self.identifier_manager.get_safe_identifier(c, "mysql") for c in chunk]
+            parts = ["COUNT(*)"]
+            for col_name, safe_col_name in zip(chunk, safe_cols):
+                parts.append("0" if col_name in not_null else f"SUM({safe_col_name} IS NULL)")
+                parts.append(f"COUNT(DISTINCT {safe_col_name})")
+            
+            if sample_size:
+                projection = ", ".join(safe_cols) or "1"
+                cursor.execute(
+                    f"SELECT {', '.join(parts)} FROM "
+                    f"(SELECT {projection} FROM {safe_table_name} LIMIT %s) AS sample_rows",
+                    (sample_size,)
+                )
+            else:
+                cursor.execute(f"SELECT {', '.join(parts)} FROM {safe_table_name}")
+            row = cursor.fetchone()
+            
+            if row_count is None:
+                row_count = row[0]
+            for i, col_name in enumerate(chunk):
+                results[col_name] = (int(row[2 * i + 1] or 0), row[2 * i + 2])
+                
+        return row_count, results
+        
+    @staticmethod
+    def _get_column_cardinality(indexes: Dict) -> Dict[str, int]:
+        """인덱스 선두 컬럼의 카디널리티 추정치 (InnoDB 통계, 컬럼별 최댓값)"""
+        cardinality = {}
+        for index_info in indexes.values():
+            value = index_info.get("cardinality")
+            if value is None or not index_info.get("columns"):
+                continue
+            col_name = index_info["columns"][0]["name"]
+            cardinality[col_name] = max(int(value), cardinality.get(col_name, 0))
+        return cardinality
+        
     def get_table_size(self, table_name: str) -> Dict:
         """테이블 크기 정보"""
+        return self.get_table_sizes_bulk([table_name]).get(table_name, {})
+        
+    def get_table_sizes_bulk(self, tables: List[str] = None) -> Dict[str, Dict]:
+        """여러 테이블의 크기 정보를 information_schema.tables 한 번 조회로 가져옴"""
+        query = """
+            SELECT 
+                table_name,
+                table_rows,
+                data_length,
+                index_length,
+                data_free
+            FROM information_schema.tables
+            WHERE table_schema = %s
+        """
+        params = [self.config["db"]]
+        if tables is None:
+            query += " AND table_type = 'BASE TABLE'"
+        elif tables:
+            query += f" AND table_name IN ({', '.join(['%s'] * len(tables))})"
+            params.extend(tables)
+        else:
+            return {}
+            
+        with self.connection.cursor() as cursor:
+            cursor.execute(query, params)
+            sizes = {row[0]: self._format_table_size(*row[1:]) for row in cursor.fetchall()}
+            
+        if tables is None:
+            return sizes
+        return {table: sizes.get(table, {}) for table in tables}
+            
+    @staticmethod
+    def _format_table_size(rows, data_size, index_size, free_size) -> Dict:
+        """information_schema.tables 크기 컬럼을 응답 형식(MB)으로 변환"""
+        return {
+            "rows": int(rows or 0),
+            "data_size_mb": round(int(data_size or 0) / (1024 * 1024), 2),
+            "index_size_mb": round(int(index_size or 0) / (1024 * 1024), 2),
+            "free_size_mb": round(int(free_size or 0) / (1024 * 1024), 2),
+            "total_size_mb": round((int(data_size or 0) + int(index_size or 0)) / (1024 * 1024), 2)
+        }
+        
+    def get_table_metadata(self, table_name: str) -> Dict:
+        """테이블 크기/인덱스/외래키 정보를 UNION ALL 단일 쿼리로 조회
+        
+        각 행의 첫 컬럼(tag)으로 출처를 구분합니다 (T: 크기, I: 인덱스, F: 외래키).
+        조회한 인덱스/외래키는 메타데이터 캐시에도 저장합니다.
+        """
+        db = self.config["db"]
         with self.connection.cursor() as cursor:
             cursor.execute("""
-                SELECT 
-                    table_rows,
-                    data_length,
-                    index_length,
-                    data_free
+                SELECT 'T' AS tag, NULL AS name1, NULL AS name2, NULL AS name3, NULL AS text1,
+                       table_rows AS num1, data_length AS num2, index_length AS num3, data_free AS num4
                 FROM information_schema.tables
                 WHERE table_schema = %s AND table_name = %s
-            """, (self.config["db"], table_name))
+                UNION ALL
+                SELECT 'I', index_name, column_name, index_type, nullable,
+                       cardinality, seq_in_index, NULL, NULL
+                FROM information_schema.statistics
+                WHERE table_schema = %s AND table_name = %s
+                UNION ALL
+                SELECT 'F', column_name, referenced_table_name, referenced_column_name, NULL,
+                       NULL, NULL, NULL, NULL
+                FROM information_schema.key_column_usage
+                WHERE constraint_schema = %s AND table_schema = %s AND table_name = %s
+                    AND referenced_table_name IS NOT NULL
+                ORDER BY tag, name1, num2
+            """, (db, table_name, db, table_name, db, db, table_name))
+            rows = cursor.fetchall()
             
-            result = cursor.fetchone()
-            if result:
-                rows, data_size, index_size, free_size = result
-                return {
-                    "rows": rows or 0,
-                    "data_size_mb": round((data_size or 0) / (1024 * 1024), 2),
-                    "index_size_mb": round((index_size or 0) / (1024 * 1024), 2),
-                    "free_size_mb": round((free_size or 0) / (1024 * 1024), 2),
-                    "total_size_mb": round(((data_size or 0) + (index_size or 0)) / (1024 * 1024), 2)
-                }
-            return {}
+        size = {}
+        indexes = {}
+        foreign_keys = []
+        for tag, name1, name2, name3, text1, num1, num2, num3, num4 in rows:
+            if tag == "T":
+                size = self._format_table_size(num1, num2, num3, num4)
+            elif tag == "I":
+                if name1 not in indexes:
+                    indexes[name1] = {
+                        "columns": [],
+                        "cardinality": num1,
+                        "type": name3
+                    }
+                indexes[name1]["columns"].append({
+                    "name": name2,
+                    "nullable": text1
+                })
+            else:
+                foreign_keys.append(dict(zip(_FK_FIELDS, (name1, name2, name3))))
+                
+        with self._meta_cache_lock:
+            self._meta_cache[("get_indexes", table_name)] = {table_name: indexes}
+            self._meta_cache[("get_foreign_keys", table_name)] = foreign_keys
             
+        return {
+            "size": size,
+            "indexes": indexes,
+            "foreign_keys": foreign_keys
+        }
+        
     def get_indexes(self, table_name: str = None) -> Dict:
+        """인덱스 정보 조회 (캐시 사용)"""
+        return self._get_cached_metadata(
+            ("get_indexes", table_name),
+            lambda: self._fetch_indexes(table_name)
+        )
+        
+    def get_indexes_bulk(self, tables: List[str] = None) -> Dict[str, Dict]:
+        """여러 테이블의 인덱스 일괄 조회 (여러 테이블이면 전체 인덱스를 한 번에 조회)"""
+        if tables is None:
+            tables = self.get_tables()
+        if len(tables) == 1:
+            return {tables[0]: self.get_indexes(tables[0]).get(tables[0], {})}
+            
+        all_indexes = self.get_indexes()
+        return {table: all_indexes.get(table, {}) for table in tables}
+        
+    def _fetch_indexes(self, table_name: str = None) -> Dict:
         """인덱스 정보 조회"""
         with self.connection.cursor() as cursor:
             if table_name:
@@ -241,7 +610,13 @@ class MySQLAdapter(DatabaseAdapter):
                 
                 return {table_name: result}
             else:
-                # 모든 테이블의 인덱스 정보
+                # 모든 테이블의 인덱스 정보 - 서버에서 인덱스별 JSON으로 집계 (미지원 시 행 단위 조회)
+                if self._use_json_index_aggregation:
+                    try:
+                        return self._fetch_all_indexes_json(cursor)
+                    except Exception:
+                        self._use_json_index_aggregation = False
+                        
                 cursor.execute("""
                     SELECT 
                         table_name,
@@ -278,74 +653,239 @@ class MySQLAdapter(DatabaseAdapter):
                 
                 return result
                 
-    def explain_query(self, query: str) -> Dict:
-        """쿼리 실행 계획 분석"""
+    def _fetch_all_indexes_json(self, cursor) -> Dict:
+        """전체 인덱스 정보를 (테이블, 인덱스)당 한 행의 JSON 집계로 조회 (MySQL 5.7.22+/MariaDB 10.5+)"""
+        cursor.execute("""
+            SELECT
+                table_name,
+                index_name,
+                MAX(CASE WHEN seq_in_index = 1 THEN cardinality END),
+                MAX(index_type),
+                JSON_ARRAYAGG(JSON_ARRAY(seq_in_index, column_name, nullable))
+            FROM information_schema.statistics
+            WHERE table_schema = %s
+            GROUP BY table_name, index_name
+            ORDER BY table_name, index_name
+        """, (self.config["db"],))
+        
+        result = {}
+        for table_name, index_name, cardinality, index_type, columns_json in cursor.fetchall():
+            # JSON_ARRAYAGG는 순서를 보장하지 않으므로 seq_in_index 기준 정렬
+            columns = sorted(json.loads(columns_json))
+            result.setdefault(table_name, {})[index_name] = {
+                "columns": [{"name": col[1], "nullable": col[2]} for col in columns],
+                "cardinality": cardinality,
+                "type": index_type
+            }
+        return result
+        
+    def explain_query(self, query: str, analyze: bool = False) -> Dict:
+        """쿼리 실행 계획 분석
+        
+        Args:
+            analyze: True이고 서버가 지원하면(MySQL 8.0.18+) EXPLAIN ANALYZE로 쿼리를 실제 실행하여
+                     실제 행 수/소요 시간이 포함된 트리 형식 계획을 반환
+        """
         with self.connection.cursor() as cursor:
+            analyzed = analyze and self._supports_explain_analyze(cursor)
+            
+            # performance_schema 미지원 또는 미확인 시 비교할 실행 전 세션 상태
+            # (첫 호출에서 이력 조회가 실패해도 상태 증분으로 대체할 수 있도록 미리 수집)
+            status_before = None
+            if self._use_statement_history is not True:
+                status_before = self._get_session_handler_status(cursor)
+                
             # EXPLAIN 실행
-            cursor.execute(f"EXPLAIN FORMAT=JSON {query}")
+            if analyzed:
+                cursor.execute(f"EXPLAIN ANALYZE {query}")
+            else:
+                cursor.execute(f"EXPLAIN FORMAT=JSON {query}")
             explain_result = cursor.fetchone()[0]
             
-            # 추가 성능 정보 수집
-            cursor.execute("SHOW SESSION STATUS LIKE 'Handler%'")
-            handler_stats = dict(cursor.fetchall())
+            # 추가 성능 정보 수집 - 직전 문장의 통계(증분)를 한 행으로 조회
+            handler_stats = None
+            if self._use_statement_history is not False:
+                try:
+                    cursor.execute("""
+                        SELECT ROWS_EXAMINED, ROWS_SENT, NO_INDEX_USED, CREATED_TMP_TABLES, SORT_ROWS
+                        FROM performance_schema.events_statements_history
+                        WHERE THREAD_ID = PS_CURRENT_THREAD_ID()
+                        ORDER BY EVENT_ID DESC LIMIT 1
+                    """)
+                    row = cursor.fetchone()
+                    if row:
+                        columns = [desc[0].lower() for desc in cursor.description]
+                        handler_stats = dict(zip(columns, row))
+                    # 이력 행이 없으면 events_statements_history 컨슈머가 꺼진 것이므로 실패와 동일하게 처리
+                    self._use_statement_history = row is not None
+                except Exception:
+                    # performance_schema 비활성화/미지원 서버는 이후 상태 증분 방식 사용
+                    self._use_statement_history = False
+                    
+            if handler_stats is None:
+                if status_before is None:
+                    handler_stats = {}
+                else:
+                    status_after = self._get_session_handler_status(cursor)
+                    handler_stats = {
+                        key: status_after[key] - status_before.get(key, 0)
+                        for key in status_after
+                    }
             
             return {
                 "explain_plan": explain_result,
+                "analyzed": analyzed,
                 "handler_stats": handler_stats
             }
             
-    def get_db_status(self) -> Dict:
-        """데이터베이스 상태 정보"""
-        with self.connection.cursor() as cursor:
-            # 서버 상태 정보
-            cursor.execute("SHOW GLOBAL STATUS")
-            global_status = dict(cursor.fetchall())
-            
-            # 변수 정보
-            cursor.execute("SHOW GLOBAL VARIABLES")
-            global_variables = dict(cursor.fetchall())
+    def _supports_explain_analyze(self, cursor) -> bool:
+        """EXPLAIN ANALYZE 지원 여부 (MySQL 8.0.18+, 서버 버전은 어댑터당 한 번만 조회)"""
+        if self._server_version is None:
+            cursor.execute("SELECT VERSION()")
+            self._server_version = cursor.fetchone()[0]
             
-            # 프로세스 목록
-            cursor.execute("SHOW PROCESSLIST")
-            processes = cursor.fetchall()
+        version = self._server_version
+        if "mariadb" in version.lower():
+            return False
+        try:
+            numbers = tuple(int(part) for part in version.split("-")[0].split(".")[:3])
+        except ValueError:
+            return False
+        return numbers >= (8, 0, 18)
+        
+    def _get_session_handler_status(self, cursor) -> Dict[str, int]:
+        """관심 있는 세션 상태 값만 서버에서 필터링하여 조회"""
+        placeholders = ", ".join(["%s"] * len(_HANDLER_STATUS_KEYS))
+        cursor.execute(f"SHOW SESSION STATUS WHERE Variable_name IN ({placeholders})", _HANDLER_STATUS_KEYS)
+        return {name: int(value) for name, value in cursor.fetchall()}
+        
+    def get_db_status(self, include_processes: bool = False) -> Dict:
+        """데이터베이스 상태 정보
+        
+        Args:
+            include_processes: True이면 SHOW PROCESSLIST 결과(가장 큰 페이로드)도 포함
+        """
+        # 서버 상태/변수 정보 - 필요한 키만 서버에서 필터링하여 조회
+        # (런타임에 거의 바뀌지 않는 변수는 SERVER_VARIABLES_CACHE_TTL 동안 재사용)
+        cached_variables = self._server_variables_cache.get("values")
+        status_placeholders = ", ".join(["%s"] * len(_STATUS_KEYS))
+        variable_placeholders = ", ".join(["%s"] * len(_VARIABLE_KEYS))
+        server_query = f"""
+            SELECT variable_name, variable_value
+            FROM performance_schema.global_status
+            WHERE variable_name IN ({status_placeholders})
+        """
+        server_params = _STATUS_KEYS
+        if cached_variables is None:
+            server_query += f"""
+            UNION ALL
+            SELECT variable_name, variable_value
+            FROM performance_schema.global_variables
+            WHERE variable_name IN ({variable_placeholders})
+            """
+            server_params += _VARIABLE_KEYS
             
-            # 연결 정보
-            cursor.execute("""
-                SELECT 
-                    COUNT(*) as total_connections,
-                    COUNT(CASE WHEN command = 'Sleep' THEN 1 END) as sleeping_connections,
-                    COUNT(CASE WHEN command != 'Sleep' THEN 1 END) as active_connections
+        # 서로 독립적인 조회 목록: 서버 값, 명령 종류별 연결 수, (선택) 프로세스 목록
+        statements = [
+            (server_query, server_params),
+            ("""
+                SELECT command, COUNT(*)
                 FROM information_schema.processlist
                 WHERE db = %s
+                GROUP BY command
             """, (self.config["db"],))
-            connection_stats = dict(zip(['total', 'sleeping', 'active'], cursor.fetchone()))
+        ]
+        if include_processes:
+            statements.append(("SHOW PROCESSLIST", ()))
             
-            return {
-                "global_status": {
-                    "queries": global_status.get("Questions", 0),
-                    "slow_queries": global_status.get("Slow_queries", 0),
-                    "threads_connected": global_status.get("Threads_connected", 0),
-                    "threads_running": global_status.get("Threads_running", 0),
-                    "bytes_received": global_status.get("Bytes_received", 0),
-                    "bytes_sent": global_status.get("Bytes_sent", 0)
-                },
-                "global_variables": {
-                    "max_connections": global_variables.get("max_connections", 0),
-                    "version": global_variables.get("version", ""),
-                    "character_set": global_variables.get("character_set_server", ""),
-                    "collation": global_variables.get("collation_server", "")
-                },
-                "connection_stats": connection_stats,
-                "processes": [
-                    {
-                        "id": p[0],
-                        "user": p[1],
-                        "host": p[2],
-                        "db": p[3],
-                        "command": p[4],
-                        "time": p[5],
-                        "state": p[6],
-                        "info": p[7]
-                    } for p in processes
-                ]
-            } 
\ No newline at end of file
+        # 1. 동시 실행 (설정 시) - 지연 시간이 조회별 RTT 합이 아닌 최댓값이 됨
+        results = None
+        if self._status_fanout and self._max_connections >= STATUS_FANOUT_MIN_CONNECTIONS:
+            try:
+                results = self._fanout(statements)
+            except Exception as e:
+                # performance_schema 미지원 등 - 이후에는 순차 실행
+                logger.warning(f"상태 조회 동시 실행 실패, 순차 실행으로 전환: {str(e)}")
+                self._status_fanout = False
+                
+        # 2. 순차 실행 (현재 연결 사용)
+        if results is None:
+            results = []
+            with self.connection.cursor() as cursor:
+                try:
+                    cursor.execute(*statements[0])
+                    results.append(cursor.fetchall())
+                except Exception:
+                    # performance_schema 비활성화/미지원 서버는 SHOW 구문으로 대체
+                    cursor.execute(f"SHOW GLOBAL STATUS WHERE Variable_name IN ({status_placeholders})", _STATUS_KEYS)
+                    server_rows = list(cursor.fetchall())
+                    if cached_variables is None:
+                        cursor.execute(f"SHOW GLOBAL VARIABLES WHERE Variable_name IN ({variable_placeholders})", _VARIABLE_KEYS)
+                        server_rows.extend(cursor.fetchall())
+                    results.append(server_rows)
+                    
+                for statement in statements[1:]:
+                    cursor.execute(*statement)
+                    results.append(cursor.fetchall())
+                    
+        server_values = dict(results[0])
+        if cached_variables is None:
+            self._server_variables_cache["values"] = {
+                key: server_values[key] for key in _VARIABLE_KEYS if key in server_values
+            }
+        else:
+            server_values.update(cached_variables)
+            
+        # 연결 정보 (명령 종류별 집계)
+        command_counts = dict(results[1])
+        total = sum(command_counts.values())
+        sleeping = command_counts.get("Sleep", 0)
+        connection_stats = {
+            "total": total,
+            "sleeping": sleeping,
+            "active": total - sleeping
+        }
+        
+        result = {
+            "global_status": {
+                "queries": server_values.get("Questions", 0),
+                "slow_queries": server_values.get("Slow_queries", 0),
+                "threads_connected": server_values.get("Threads_connected", 0),
+                "threads_running": server_values.get("Threads_running", 0),
+                "bytes_received": server_values.get("Bytes_received", 0),
+                "bytes_sent": server_values.get("Bytes_sent", 0)
+            },
+            "global_variables": {
+                "max_connections": server_values.get("max_connections", 0),
+                "version": server_values.get("version", ""),
+                "character_set": server_values.get("character_set_server", ""),
+                "collation": server_values.get("collation_server", "")
+            },
+            "connection_stats": connection_stats
+        }
+        
+        # 프로세스 목록 (요청 시에만)
+        if include_processes:
+            result["processes"] = [dict(zip(_PROCESSLIST_KEYS, p)) for p in results[2]]
+            
+        return result
+        
+    def _fanout(self, statements: List[Tuple[str, tuple]]) -> List[tuple]:
+        """서로 독립적인 조회를 풀의 별도 연결에서 동시에 실행
+        
+        Returns:
+            statements 순서대로 각 조회의 fetchall() 결과
+        """
+        pool = _get_pool(self._secure_config, self._pool_key, self._pool_size, self._max_connections)
+        
+        def run(statement):
+            connection = pool.connection()
+            try:
+                with connection.cursor() as cursor:
+                    cursor.execute(*statement)
+                    return cursor.fetchall()
+            finally:
+                connection.close()
+                
+        with ThreadPoolExecutor(max_workers=len(statements)) as executor:
+            return list(executor.map(run, statements))
\ No newline at end of file
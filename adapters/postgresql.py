@@ -3,18 +3,61 @@ PostgreSQL adapter for MCP server.
 """
 
 import logging
-from typing import Dict, List, Any
-from .base import DatabaseAdapter
+import os
+import re
+import sys
+import threading
+import uuid
+from collections import defaultdict
+from contextlib import contextmanager
+from itertools import islice
+from typing import Dict, List, Any, Tuple, Iterator
+from .base import DatabaseAdapter, STATS_MODES, STATS_COLUMNS_PER_QUERY, STATS_SAMPLE_THRESHOLD
+from security.identifier_manager import quote_identifier
 
 logger = logging.getLogger(__name__)
 
 try:
     import psycopg2
-    import psycopg2.extras
+    import psycopg2.pool
     PSYCOPG2_AVAILABLE = True
 except ImportError:
     PSYCOPG2_AVAILABLE = False
 
+# max_rows 지정 시 fetchmany로 한 번에 가져올 행 수
+FETCH_CHUNK_SIZE = 1000
+
+# 서버 측(named) 커서로 스트리밍할 수 있는 쿼리 (DECLARE CURSOR는 SELECT만 허용)
+_SERVER_CURSOR_RE = re.compile(r'\s*SELECT\b', re.IGNORECASE)
+
+# 보안 세션 설정 - 연결 시작 파라미터(options)로 전달하여 물리 연결 생성 시 한 번만 적용
+_SESSION_OPTIONS = (
+    "-c statement_timeout=30s "                   # 쿼리 타임아웃
+    "-c lock_timeout=10s "                        # 락 타임아웃
+    "-c idle_in_transaction_session_timeout=60s"  # 유휴 세션 타임아웃
+)
+
+# 연결 설정별 커넥션 풀 (프로세스 전역 공유)
+_POOLS: Dict[tuple, "psycopg2.pool.ThreadedConnectionPool"] = {}
+_POOLS_LOCK = threading.Lock()
+
+def _get_pool(pg_config: dict, key: tuple, pool_size: int, max_connections: int):
+    """연결 설정에 해당하는 커넥션 풀 반환 (없으면 생성)
+    
+    ThreadedConnectionPool은 minconn개까지 반납된 연결을 유지하므로
+    pool_size를 유휴 연결 유지 수로 사용합니다.
+    """
+    with _POOLS_LOCK:
+        pool = _POOLS.get(key)
+        if pool is None:
+            pool = psycopg2.pool.ThreadedConnectionPool(
+                minconn=min(pool_size, max_connections),
+                maxconn=max_connections,
+                **pg_config
+            )
+            _POOLS[key] = pool
+        return pool
+
 class PostgreSQLAdapter(DatabaseAdapter):
     """PostgreSQL 어댑터"""
     
@@ -23,71 +66,201 @@ class PostgreSQLAdapter(DatabaseAdapter):
             raise ImportError("psycopg2가 설치되지 않았습니다. 'pip install psycopg2-binary'를 실행하세요.")
         super().__init__(config)
         
+        # 커넥션 풀 크기 (config 값 우선, 없으면 환경변수)
+        self._pool_size = int(config.get('pool_size', os.getenv("CONNECTION_POOL_SIZE", "5")))
+        self._max_connections = int(config.get('max_connections', os.getenv("MAX_CONNECTIONS", "10")))
+        
+        # PostgreSQL 연결 파라미터 변환 (연결마다 만들지 않도록 한 번만 구성)
+        self._pg_config = {
+            'host': config.get('host', 'localhost'),
+            'port': config.get('port', 5432),
+            'database': config.get('db'),
+            'user': config.get('user'),
+            'password': config.get('password'),
+            'connect_timeout': 10,
+            'application_name': 'mcp-db-server-secure',
+            # SSL 강제 (가능한 경우)
+            'sslmode': config.get('sslmode', 'prefer'),
+            'options': _SESSION_OPTIONS
+        }
+        self._pool_key = (frozenset(self._pg_config.items()), self._pool_size, self._max_connections)
+        
     def connect(self):
-        """PostgreSQL 데이터베이스 연결 (보안 강화)"""
+        """PostgreSQL 데이터베이스 연결 (보안 강화, 커넥션 풀 사용)"""
         try:
-            # PostgreSQL 연결 파라미터 변환
-            pg_config = {
-                'host': self.config.get('host', 'localhost'),
-                'port': self.config.get('port', 5432),
-                'database': self.config.get('db'),
-                'user': self.config.get('user'),
-                'password': self.config.get('password'),
-                'connect_timeout': 10,
-                'application_name': 'mcp-db-server-secure'
-            }
-            
-            # SSL 강제 (가능한 경우)
-            if 'sslmode' not in pg_config:
-                pg_config['sslmode'] = 'prefer'
+            pool = _get_pool(self._pg_config, self._pool_key, self._pool_size, self._max_connections)
             
-            self.connection = psycopg2.connect(**pg_config)
-            self.connection.autocommit = True
-            
-            # 추가 보안 설정
-            with self.connection.cursor() as cursor:
-                # 보안 관련 설정
-                cursor.execute("SET statement_timeout = '30s'")  # 쿼리 타임아웃
-                cursor.execute("SET lock_timeout = '10s'")       # 락 타임아웃
-                cursor.execute("SET idle_in_transaction_session_timeout = '60s'")  # 유휴 세션 타임아웃
+            # 풀에서 살아 있는 연결 획득
+            self.connection = self._checkout_connection(pool)
                 
             logger.info("PostgreSQL 데이터베이스 연결 성공 (보안 강화)")
             
-            # 스키마 캐시 로드
-            self.identifier_manager.load_schema_cache(self)
-            
         except Exception as e:
             logger.error(f"PostgreSQL 연결 실패: {str(e)}")
             raise
             
+    def _checkout_connection(self, pool):
+        """풀에서 연결을 꺼내 사용 가능 여부를 확인 (MySQL PooledDB의 ping=1과 같은 역할)
+        
+        psycopg2의 closed는 작업이 실패한 뒤에야 설정되므로, 유휴 타임아웃/서버 재시작/
+        pg_terminate_backend로 서버가 끊은 연결은 SELECT 1로 확인합니다.
+        끊긴 연결은 폐기하고 다시 획득하며, 서버 재시작 시 풀의 유휴 연결이 모두 끊겼을 수 있으므로
+        최대 연결 수만큼 재시도합니다.
+        """
+        for attempt in range(self._max_connections + 1):
+            connection = pool.getconn()
+            try:
+                if connection.closed:
+                    raise psycopg2.InterfaceError("connection already closed")
+                # 이미 autocommit인 연결에서는 서버 왕복 없음 (확인 쿼리가 트랜잭션을 열지 않도록 먼저 설정)
+                if not connection.autocommit:
+                    connection.autocommit = True
+                with connection.cursor() as cursor:
+                    cursor.execute("SELECT 1")
+                return connection
+            except (psycopg2.OperationalError, psycopg2.InterfaceError) as e:
+                pool.putconn(connection, close=True)
+                if attempt == self._max_connections:
+                    raise
+                logger.warning(f"끊어진 PostgreSQL 연결 폐기 후 재연결: {str(e)}")
+                
     def disconnect(self):
-        """PostgreSQL 데이터베이스 연결 해제"""
+        """PostgreSQL 데이터베이스 연결 해제 (풀에 반납)"""
         if self.connection:
-            self.connection.close()
-            self.connection = None
+            connection, self.connection = self.connection, None
+            pool = _POOLS.get(self._pool_key)
+            if pool is None:
+                connection.close()
+                return
+            # 끊어졌거나 트랜잭션이 정리되지 않은 연결은 재사용하지 않음
+            broken = bool(connection.closed) or (
+                connection.info.transaction_status != psycopg2.extensions.TRANSACTION_STATUS_IDLE
+            )
+            pool.putconn(connection, close=broken)
             
     def _quote_identifier(self, identifier: str) -> str:
         """PostgreSQL 식별자 인용부호 처리"""
-        return f'"{identifier}"'
+        return quote_identifier(identifier, "postgresql")
+        
+    def execute_query(self, query: str, params: tuple = None, max_rows: int = None) -> List[Dict]:
+        """PostgreSQL 쿼리 실행 (보안 강화)
         
-    def execute_query(self, query: str, params: tuple = None) -> List[Dict]:
-        """PostgreSQL 쿼리 실행 (보안 강화)"""
+        max_rows가 지정된 SELECT는 서버 측 커서로 필요한 행만 가져옵니다.
+        (일반 커서는 libpq가 전체 결과를 클라이언트 메모리로 받은 뒤에야 반환)
+        """
+        if max_rows is not None and _SERVER_CURSOR_RE.match(query):
+            return list(self.execute_query_iter(query, params, max_rows))
+            
         try:
             # 1. 읽기 전용 모드 검증
             if self.read_only:
                 self.validator.validate_query(query, "postgresql")
             
             # 2. 쿼리 실행
-            with self.connection.cursor(cursor_factory=psycopg2.extras.RealDictCursor) as cursor:
+            with self.connection.cursor() as cursor:
+                cursor.execute(query, params or ())
+                self._invalidate_after_ddl(query)
+                return self._fetch_rows(cursor, max_rows)
+                
+        except Exception as e:
+            logger.error(f"쿼리 실행 실패: {str(e)}")
+            raise
+            
+    def execute_query_iter(self, query: str, params: tuple = None, max_rows: int = None) -> Iterator[Dict]:
+        """PostgreSQL 쿼리 실행 - SELECT는 서버 측 커서로 FETCH_CHUNK_SIZE 단위 스트리밍 (보안 강화)"""
+        if not _SERVER_CURSOR_RE.match(query):
+            return iter(self.execute_query(query, params, max_rows))
+            
+        try:
+            # 1. 읽기 전용 모드 검증 (이터레이터 생성 시점에 즉시 수행)
+            if self.read_only:
+                self.validator.validate_query(query, "postgresql")
+        except Exception as e:
+            logger.error(f"쿼리 실행 실패: {str(e)}")
+            raise
+            
+        return self._stream_query(query, params, max_rows)
+        
+    def _stream_query(self, query: str, params: tuple = None, max_rows: int = None) -> Iterator[Dict]:
+        """서버 측 커서 결과를 딕셔너리 행으로 반환 (max_rows개에서 중단)"""
+        try:
+            with self._server_cursor() as cursor:
+                cursor.execute(query, params or ())
+                
+                # 서버 측 커서의 컬럼 정보는 첫 FETCH 이후에 채워짐
+                keys = None
+                for row in islice(cursor, max_rows):
+                    if keys is None:
+                        keys = [sys.intern(desc.name) for desc in cursor.description]
+                    yield dict(zip(keys, row))
+                    
+        except Exception as e:
+            logger.error(f"쿼리 실행 실패: {str(e)}")
+            raise
+            
+    @contextmanager
+    def _server_cursor(self):
+        """서버 측(named) 커서 생성 - DECLARE CURSOR에 필요한 트랜잭션을 열고 종료 시 롤백"""
+        connection = self.connection
+        connection.autocommit = False
+        try:
+            with connection.cursor(name=f"mcp_{uuid.uuid4().hex}") as cursor:
+                cursor.itersize = FETCH_CHUNK_SIZE
+                yield cursor
+        finally:
+            # 읽기 전용 트랜잭션이므로 롤백으로 종료하고 autocommit 복원
+            if not connection.closed:
+                connection.rollback()
+                connection.autocommit = True
+                
+    def execute_query_with_columns(self, query: str, params: tuple = None,
+                                   max_rows: int = None) -> Tuple[List[str], List[Dict]]:
+        """PostgreSQL 쿼리 실행 결과와 컬럼명 목록 반환 (빈 결과도 컬럼 정보 포함)"""
+        try:
+            # 1. 읽기 전용 모드 검증
+            if self.read_only:
+                self.validator.validate_query(query, "postgresql")
+            
+            # 2. 쿼리 실행 - 컬럼명은 커서 메타데이터에서 추출
+            with self.connection.cursor() as cursor:
                 cursor.execute(query, params or ())
-                rows = cursor.fetchall()
-                return [dict(row) for row in rows]
+                self._invalidate_after_ddl(query)
+                
+                if not cursor.description:
+                    return [], []
+                columns = [desc.name for desc in cursor.description]
+                return columns, self._fetch_rows(cursor, max_rows)
                 
         except Exception as e:
             logger.error(f"쿼리 실행 실패: {str(e)}")
             raise
             
+    def _fetch_rows(self, cursor, max_rows: int = None) -> List[Dict]:
+        """결과를 FETCH_CHUNK_SIZE 단위로 가져오며 max_rows개에 도달하면 중단
+        
+        RealDictCursor처럼 행마다 Python 단에서 키를 하나씩 채우는 대신
+        튜플 행을 컬럼명과 zip하여 딕셔너리를 만듭니다 (컬럼명은 intern하여 공유).
+        """
+        if not cursor.description:
+            return []
+        keys = [sys.intern(desc.name) for desc in cursor.description]
+        
+        if max_rows is None:
+            return [dict(zip(keys, row)) for row in cursor.fetchall()]
+            
+        rows = []
+        while len(rows) < max_rows:
+            batch = cursor.fetchmany(min(FETCH_CHUNK_SIZE, max_rows - len(rows)))
+            if not batch:
+                break
+            rows.extend(dict(zip(keys, row)) for row in batch)
+        return rows
+            
     def get_tables(self) -> List[str]:
+        """테이블 목록 조회 (캐시 사용)"""
+        return self._get_cached_metadata(("get_tables", None), self._fetch_tables)
+        
+    def _fetch_tables(self) -> List[str]:
         """테이블 목록 조회"""
         schema = self.config.get('schema', 'public')
         with self.connection.cursor() as cursor:
@@ -100,106 +273,125 @@ class PostgreSQLAdapter(DatabaseAdapter):
             return [row[0] for row in cursor.fetchall()]
             
     def get_table_schema(self, table_name: str) -> List[Dict]:
+        """테이블 스키마 조회 (캐시 사용)"""
+        return self._get_cached_metadata(
+            ("get_table_schema", table_name),
+            lambda: self._fetch_table_schema(table_name)
+        )
+        
+    def _fetch_table_schema(self, table_name: str) -> List[Dict]:
         """테이블 스키마 조회"""
+        return self._fetch_table_schema_bulk([table_name]).get(table_name, [])
+        
+    def get_table_schema_bulk(self, tables: List[str] = None) -> Dict[str, List[Dict]]:
+        """여러 테이블의 스키마 일괄 조회 (캐시 사용, 미캐시 테이블은 한 번에 조회)"""
+        if tables is None:
+            tables = self.get_tables()
+        return self._get_cached_metadata_bulk("get_table_schema", tables, self._fetch_table_schema_bulk)
+        
+    def _fetch_table_schema_bulk(self, tables: List[str]) -> Dict[str, List[Dict]]:
+        """pg_catalog 조회 한 번으로 여러 테이블 스키마 조회
+        
+        information_schema 뷰의 행 단위 타입 변환을 피하기 위해 pg_attribute를 직접 조회하고,
+        타입 문자열은 format_type(), 키 정보는 pg_index 서브쿼리로 함께 가져옵니다.
+        """
         schema = self.config.get('schema', 'public')
         with self.connection.cursor() as cursor:
             cursor.execute("""
                 SELECT 
-                    column_name,
-                    data_type,
-                    is_nullable,
-                    column_default,
-                    character_maximum_length,
-                    numeric_precision,
-                    numeric_scale
-                FROM information_schema.columns
-                WHERE table_schema = %s AND table_name = %s
-                ORDER BY ordinal_position
-            """, (schema, table_name))
-            
-            columns = cursor.fetchall()
-            
-            # 키 정보 조회
-            cursor.execute("""
-                SELECT a.attname, i.indisprimary, i.indisunique
-                FROM pg_index i
-                JOIN pg_attribute a ON a.attrelid = i.indrelid AND a.attnum = ANY(i.indkey)
-                JOIN pg_class c ON c.oid = i.indrelid
+                    c.relname,
+                    a.attname,
+                    format_type(a.atttypid, a.atttypmod),
+                    a.attnotnull,
+                    pg_get_expr(d.adbin, d.adrelid),
+                    (SELECT CASE WHEN bool_or(i.indisprimary) THEN 'PRI'
+                                 WHEN bool_or(i.indisunique) THEN 'UNI'
+                                 ELSE '' END
+                     FROM pg_index i
+                     WHERE i.indrelid = c.oid AND a.attnum = ANY(i.indkey))
+                FROM pg_attribute a
+                JOIN pg_class c ON c.oid = a.attrelid
                 JOIN pg_namespace n ON n.oid = c.relnamespace
-                WHERE n.nspname = %s AND c.relname = %s
-            """, (schema, table_name))
+                LEFT JOIN pg_attrdef d ON d.adrelid = a.attrelid AND d.adnum = a.attnum
+                WHERE n.nspname = %s AND c.relname = ANY(%s)
+                    AND a.attnum > 0 AND NOT a.attisdropped
+                ORDER BY c.relname, a.attnum
+            """, (schema, list(tables)))
             
-            key_info = {}
-            for row in cursor.fetchall():
-                col_name, is_primary, is_unique = row
-                key_type = ""
-                if is_primary:
-                    key_type = "PRI"
-                elif is_unique:
-                    key_type = "UNI"
-                key_info[col_name] = key_type
-            
-            return [
-                {
-                    "name": col[0],
-                    "type": self._format_pg_type(col[1], col[4], col[5], col[6]),
-                    "nullable": col[2] == "YES",
-                    "key": key_info.get(col[0], ""),
-                    "default": col[3],
+            schemas = defaultdict(list)
+            for col in cursor.fetchall():
+                schemas[col[0]].append({
+                    "name": col[1],
+                    "type": col[2],
+                    "nullable": not col[3],
+                    "key": col[5] or "",
+                    "default": col[4],
                     "extra": ""
-                } for col in columns
-            ]
-            
-    def _format_pg_type(self, data_type: str, char_length: int, num_precision: int, num_scale: int) -> str:
-        """PostgreSQL 데이터 타입 포맷팅"""
-        if data_type in ['character varying', 'varchar']:
-            return f"varchar({char_length})" if char_length else "varchar"
-        elif data_type == 'character':
-            return f"char({char_length})" if char_length else "char"
-        elif data_type in ['numeric', 'decimal']:
-            if num_precision and num_scale:
-                return f"numeric({num_precision},{num_scale})"
-            elif num_precision:
-                return f"numeric({num_precision})"
-            else:
-                return "numeric"
-        return data_type
+                })
+            return schemas
         
     def get_foreign_keys(self, table_name: str) -> List[Dict]:
+        """외래키 정보 조회 (캐시 사용)"""
+        return self._get_cached_metadata(
+            ("get_foreign_keys", table_name),
+            lambda: self._fetch_foreign_keys(table_name)
+        )
+        
+    def _fetch_foreign_keys(self, table_name: str) -> List[Dict]:
         """외래키 정보 조회"""
+        return self._fetch_foreign_keys_bulk([table_name]).get(table_name, [])
+        
+    def get_foreign_keys_bulk(self, tables: List[str] = None) -> Dict[str, List[Dict]]:
+        """여러 테이블의 외래키 일괄 조회 (캐시 사용, 미캐시 테이블은 단일 쿼리)"""
+        if tables is None:
+            tables = self.get_tables()
+        return self._get_cached_metadata_bulk("get_foreign_keys", tables, self._fetch_foreign_keys_bulk)
+        
+    def _fetch_foreign_keys_bulk(self, tables: List[str]) -> Dict[str, List[Dict]]:
+        """pg_constraint 조회 한 번으로 여러 테이블 외래키 조회 (복합 외래키는 컬럼 쌍 단위)"""
         schema = self.config.get('schema', 'public')
         with self.connection.cursor() as cursor:
             cursor.execute("""
                 SELECT 
-                    kcu.column_name,
-                    ccu.table_name AS referenced_table,
-                    ccu.column_name AS referenced_column
-                FROM information_schema.table_constraints tc
-                JOIN information_schema.key_column_usage kcu 
-                    ON tc.constraint_name = kcu.constraint_name
-                    AND tc.table_schema = kcu.table_schema
-                JOIN information_schema.constraint_column_usage ccu 
-                    ON ccu.constraint_name = tc.constraint_name
-                    AND ccu.table_schema = tc.table_schema
-                WHERE tc.constraint_type = 'FOREIGN KEY'
-                    AND tc.table_schema = %s
-                    AND tc.table_name = %s
-            """, (schema, table_name))
+                    c.relname,
+                    a.attname,
+                    rc.relname AS referenced_table,
+                    ra.attname AS referenced_column
+                FROM pg_constraint con
+                JOIN pg_class c ON c.oid = con.conrelid
+                JOIN pg_namespace n ON n.oid = c.relnamespace
+                JOIN pg_class rc ON rc.oid = con.confrelid
+                CROSS JOIN LATERAL unnest(con.conkey, con.confkey) WITH ORDINALITY AS k(attnum, ref_attnum, pos)
+                JOIN pg_attribute a ON a.attrelid = con.conrelid AND a.attnum = k.attnum
+                JOIN pg_attribute ra ON ra.attrelid = con.confrelid AND ra.attnum = k.ref_attnum
+                WHERE con.contype = 'f'
+                    AND n.nspname = %s
+                    AND c.relname = ANY(%s)
+                ORDER BY c.relname, con.conname, k.pos
+            """, (schema, list(tables)))
             
-            foreign_keys = cursor.fetchall()
-            return [
-                {
-                    "column": fk[0],
-                    "referenced_table": fk[1],
-                    "referenced_column": fk[2]
-                } for fk in foreign_keys
-            ]
+            foreign_keys = defaultdict(list)
+            for fk in cursor.fetchall():
+                foreign_keys[fk[0]].append({
+                    "column": fk[1],
+                    "referenced_table": fk[2],
+                    "referenced_column": fk[3]
+                })
+            return foreign_keys
             
-    def get_table_stats(self, table_name: str) -> Dict:
-        """테이블 통계 정보 (보안 강화)"""
+    def get_table_stats(self, table_name: str, stats_mode: str = "auto", columns: List[str] = None) -> Dict:
+        """테이블 통계 정보 (보안 강화)
+        
+        Args:
+            stats_mode: "exact"(전체 스캔), "approx"(pg_class.reltuples/pg_stats 추정치),
+                        "auto"(추정 행 수가 STATS_SAMPLE_THRESHOLD를 넘을 때만 근사)
+            columns: 통계를 계산할 컬럼 목록. None이면 전체 컬럼
+        """
         try:
             # 1. 테이블명 검증
             self.identifier_manager.validate_table_name(table_name)
+            if stats_mode not in STATS_MODES:
+                raise ValueError(f"지원하지 않는 통계 방식입니다: {stats_mode} (허용: {', '.join(STATS_MODES)})")
             
             schema = self.config.get('schema', 'public')
             with self.connection.cursor() as cursor:
@@ -207,32 +399,44 @@ class PostgreSQLAdapter(DatabaseAdapter):
                 safe_schema = self.identifier_manager.get_safe_identifier(schema, "postgresql")
                 safe_table_name = self.identifier_manager.get_safe_identifier(table_name, "postgresql")
                 
-                # 3. 전체 행 수 조회
-                cursor.execute(f'SELECT COUNT(*) FROM {safe_schema}.{safe_table_name}')
-                total_rows = cursor.fetchone()[0]
-                
-                # 4. 컬럼별 통계
+                # 3. 컬럼 목록 조회 및 검증
                 table_schema = self.get_table_schema(table_name)
-                column_stats = {}
+                if columns is None:
+                    columns = [col['name'] for col in table_schema]
+                col_names = list(columns)
+                self.identifier_manager.validate_column_names(table_name, col_names)
                 
-                for col in table_schema:
-                    col_name = col['name']
-                    
-                    # 컬럼명 검증
-                    self.identifier_manager.validate_column_name(table_name, col_name)
-                    safe_col_name = self.identifier_manager.get_safe_identifier(col_name, "postgresql")
-                    
-                    # NULL 값 비율
-                    cursor.execute(f'SELECT COUNT(*) FROM {safe_schema}.{safe_table_name} WHERE {safe_col_name} IS NULL')
-                    null_count = cursor.fetchone()[0]
+                # NOT NULL 컬럼은 NULL 수 집계 생략
+                not_null = {col['name'] for col in table_schema if not col['nullable']}
+                
+                # 4. 대용량 테이블은 ANALYZE가 수집한 pg_stats 추정치 사용
+                # (통계가 없는 컬럼이 있으면 정확한 집계로 대체)
+                aggregated = None
+                approximate = False
+                if stats_mode != "exact":
+                    estimated_rows, pg_stats = self._get_planner_stats(cursor, schema, table_name)
+                    wanted = stats_mode == "approx" or estimated_rows > STATS_SAMPLE_THRESHOLD
+                    if wanted and estimated_rows >= 0 and all(c in pg_stats for c in col_names):
+                        total_rows = estimated_rows
+                        aggregated = {}
+                        for col_name in col_names:
+                            null_frac, n_distinct = pg_stats[col_name]
+                            # n_distinct가 음수면 행 수 대비 비율
+                            if n_distinct < 0:
+                                n_distinct = -n_distinct * total_rows
+                            aggregated[col_name] = (round(null_frac * total_rows), round(n_distinct))
+                        approximate = True
+                
+                if aggregated is None:
+                    total_rows, aggregated = self._aggregate_column_stats(
+                        cursor, f"{safe_schema}.{safe_table_name}", col_names, not_null=not_null
+                    )
+                
+                column_stats = {}
+                for col_name, (null_count, unique_count) in aggregated.items():
                     null_ratio = (null_count / total_rows * 100) if total_rows > 0 else 0
                     
-                    # 고유값 수
-                    cursor.execute(f'SELECT COUNT(DISTINCT {safe_col_name}) FROM {safe_schema}.{safe_table_name}')
-                    unique_count = cursor.fetchone()[0]
-                    
                     column_stats[col_name] = {
-                        "total_rows": total_rows,
                         "null_count": null_count,
                         "null_ratio": round(null_ratio, 2),
                         "unique_values": unique_count
@@ -241,139 +445,164 @@ class PostgreSQLAdapter(DatabaseAdapter):
                 return {
                     "table_name": table_name,
                     "total_rows": total_rows,
-                    "column_stats": column_stats
+                    "column_stats": column_stats,
+                    "unique_values_approx": approximate
                 }
         except Exception as e:
             logger.error(f"테이블 통계 조회 실패: {str(e)}")
             raise
             
+    def _aggregate_column_stats(self, cursor, safe_table_name: str, col_names: List[str],
+                                not_null: set = frozenset()):
+        """전체 행 수와 컬럼별 NULL 수/고유값 수를 집계 쿼리로 조회
+        
+        컬럼마다 2번씩 쿼리하는 대신 테이블을 한 번만 스캔하며,
+        SELECT 표현식 수 제한을 피하기 위해 컬럼을 묶음 단위로 처리합니다.
+        not_null에 포함된 컬럼은 NULL 수를 0으로 두고 집계하지 않습니다.
+        
+        Returns:
+            (행 수, {컬럼명: (null_count, unique_count)})
+        """
+        row_count = None
+        results = {}
+        chunks = [col_names[i:i + STATS_COLUMNS_PER_QUERY]
+                  for i in range(0, len(col_names), STATS_COLUMNS_PER_QUERY)] or [[]]
+        
+        for chunk in chunks:
+            parts = ["COUNT(*)"]
+            for col_name in chunk:
+                safe_col_name = self.identifier_manager.get_safe_identifier(col_name, "postgresql")
+                parts.append("0" if col_name in not_null else f"COUNT(*) - COUNT({safe_col_name})")
+                parts.append(f"COUNT(DISTINCT {safe_col_name})")
+            
+            cursor.execute(f"SELECT {', '.join(parts)} FROM {safe_table_name}")
+            row = cursor.fetchone()
+            
+            if row_count is None:
+                row_count = row[0]
+            for i, col_name in enumerate(chunk):
+                results[col_name] = (row[2 * i + 1], row[2 * i + 2])
+                
+        return row_count, results
+        
+    def _get_planner_stats(self, cursor, schema: str, table_name: str):
+        """pg_class.reltuples와 pg_stats의 컬럼별 null_frac/n_distinct 조회
+        
+        Returns:
+            (추정 행 수 - 통계가 없으면 -1, {컬럼명: (null_frac, n_distinct)})
+        """
+        cursor.execute("""
+            SELECT c.reltuples, s.attname, s.null_frac, s.n_distinct
+            FROM pg_class c
+            JOIN pg_namespace n ON n.oid = c.relnamespace
+            LEFT JOIN pg_stats s ON s.schemaname = n.nspname AND s.tablename = c.relname
+            WHERE n.nspname = %s AND c.relname = %s
+        """, (schema, table_name))
+        
+        estimated_rows = -1
+        stats = {}
+        for reltuples, attname, null_frac, n_distinct in cursor.fetchall():
+            estimated_rows = int(reltuples)
+            if attname is not None:
+                stats[attname] = (float(null_frac or 0), float(n_distinct or 0))
+        return estimated_rows, stats
+            
     def get_table_size(self, table_name: str) -> Dict:
         """테이블 크기 정보"""
+        return self.get_table_sizes_bulk([table_name]).get(table_name, {})
+        
+    def get_table_sizes_bulk(self, tables: List[str] = None) -> Dict[str, Dict]:
+        """여러 테이블의 크기와 추정 행 수를 pg_class 한 번 조회로 가져옴"""
         schema = self.config.get('schema', 'public')
+        if tables is not None and not tables:
+            return {}
+        table_filter = "AND c.relname = ANY(%s)" if tables is not None else "AND c.relkind IN ('r', 'p')"
+        params = (schema, list(tables)) if tables is not None else (schema,)
+        
         with self.connection.cursor() as cursor:
-            cursor.execute("""
-                SELECT 
-                    schemaname,
-                    tablename,
-                    attname,
-                    n_distinct,
-                    most_common_vals,
-                    most_common_freqs,
-                    histogram_bounds
-                FROM pg_stats
-                WHERE schemaname = %s AND tablename = %s
-                LIMIT 1
-            """, (schema, table_name))
-            
-            # 테이블 크기 정보
-            cursor.execute("""
+            cursor.execute(f"""
                 SELECT 
+                    c.relname,
                     pg_total_relation_size(c.oid) as total_size,
                     pg_relation_size(c.oid) as table_size,
                     pg_total_relation_size(c.oid) - pg_relation_size(c.oid) as index_size,
-                    (SELECT count(*) FROM information_schema.columns WHERE table_schema = %s AND table_name = %s) as column_count
+                    s.n_tup_ins - s.n_tup_del as estimated_rows
                 FROM pg_class c
                 JOIN pg_namespace n ON n.oid = c.relnamespace
-                WHERE n.nspname = %s AND c.relname = %s
-            """, (schema, table_name, schema, table_name))
+                LEFT JOIN pg_stat_user_tables s ON s.relid = c.oid
+                WHERE n.nspname = %s {table_filter}
+            """, params)
             
-            result = cursor.fetchone()
-            if result:
-                total_size, table_size, index_size, column_count = result
-                
-                # 행 수 추정
-                cursor.execute("""
-                    SELECT n_tup_ins - n_tup_del as estimated_rows
-                    FROM pg_stat_user_tables
-                    WHERE schemaname = %s AND relname = %s
-                """, (schema, table_name))
-                
-                row_count_result = cursor.fetchone()
-                estimated_rows = row_count_result[0] if row_count_result else 0
-                
-                return {
+            sizes = {}
+            for table, total_size, table_size, index_size, estimated_rows in cursor.fetchall():
+                sizes[table] = {
                     "rows": estimated_rows or 0,
                     "data_size_mb": round((table_size or 0) / (1024 * 1024), 2),
                     "index_size_mb": round((index_size or 0) / (1024 * 1024), 2),
                     "free_size_mb": 0.0,  # PostgreSQL doesn't have direct equivalent
                     "total_size_mb": round((total_size or 0) / (1024 * 1024), 2)
                 }
-            return {}
+                
+        if tables is None:
+            return sizes
+        return {table: sizes.get(table, {}) for table in tables}
             
     def get_indexes(self, table_name: str = None) -> Dict:
-        """인덱스 정보 조회"""
+        """인덱스 정보 조회 (캐시 사용)"""
+        return self._get_cached_metadata(
+            ("get_indexes", table_name),
+            lambda: self._fetch_indexes(table_name)
+        )
+        
+    def get_indexes_bulk(self, tables: List[str] = None) -> Dict[str, Dict]:
+        """여러 테이블의 인덱스 일괄 조회 (여러 테이블이면 전체 인덱스를 한 번에 조회)"""
+        if tables is None:
+            tables = self.get_tables()
+        if len(tables) == 1:
+            return {tables[0]: self.get_indexes(tables[0]).get(tables[0], {})}
+            
+        all_indexes = self.get_indexes()
+        return {table: all_indexes.get(table, {}) for table in tables}
+        
+    def _fetch_indexes(self, table_name: str = None) -> Dict:
+        """인덱스 정보 조회 (인덱스당 한 행, 컬럼 목록은 array_agg로 서버에서 집계)"""
         schema = self.config.get('schema', 'public')
+        table_filter = "AND t.relname = %s" if table_name else ""
+        params = (schema, table_name) if table_name else (schema,)
         with self.connection.cursor() as cursor:
-            if table_name:
-                cursor.execute("""
-                    SELECT 
-                        i.relname as index_name,
-                        a.attname as column_name,
-                        ix.indisunique,
-                        ix.indisprimary,
-                        am.amname as index_type
-                    FROM pg_class t
-                    JOIN pg_index ix ON t.oid = ix.indrelid
-                    JOIN pg_class i ON i.oid = ix.indexrelid
-                    JOIN pg_attribute a ON a.attrelid = t.oid AND a.attnum = ANY(ix.indkey)
-                    JOIN pg_namespace n ON n.oid = t.relnamespace
-                    JOIN pg_am am ON i.relam = am.oid
-                    WHERE n.nspname = %s AND t.relname = %s
-                    ORDER BY i.relname, a.attnum
-                """, (schema, table_name))
-                
-                indexes = cursor.fetchall()
-                result = {}
-                
-                for idx in indexes:
-                    index_name = idx[0]
-                    if index_name not in result:
-                        result[index_name] = {
-                            "columns": [],
-                            "cardinality": 0,  # PostgreSQL doesn't provide direct cardinality
-                            "type": idx[4],
-                            "unique": idx[2],
-                            "primary": idx[3]
-                        }
-                    
-                    result[index_name]["columns"].append({
-                        "name": idx[1],
-                        "nullable": True  # 기본값
-                    })
-                
-                return {table_name: result}
-            else:
-                # 모든 테이블의 인덱스 정보 (간소화된 버전)
-                cursor.execute("""
-                    SELECT DISTINCT
-                        t.relname as table_name,
-                        i.relname as index_name
-                    FROM pg_class t
-                    JOIN pg_index ix ON t.oid = ix.indrelid
-                    JOIN pg_class i ON i.oid = ix.indexrelid
-                    JOIN pg_namespace n ON n.oid = t.relnamespace
-                    WHERE n.nspname = %s
-                    ORDER BY t.relname, i.relname
-                """, (schema,))
-                
-                indexes = cursor.fetchall()
-                result = {}
-                
-                for idx in indexes:
-                    table_name, index_name = idx[0], idx[1]
-                    if table_name not in result:
-                        result[table_name] = {}
-                    
-                    result[table_name][index_name] = {
-                        "columns": [],
-                        "cardinality": 0,
-                        "type": "btree"  # 기본값
-                    }
-                
-                return result
+            cursor.execute(f"""
+                SELECT 
+                    t.relname as table_name,
+                    i.relname as index_name,
+                    am.amname as index_type,
+                    ix.indisunique,
+                    ix.indisprimary,
+                    array_agg(a.attname::text ORDER BY k.pos) as columns
+                FROM pg_class t
+                JOIN pg_index ix ON t.oid = ix.indrelid
+                JOIN pg_class i ON i.oid = ix.indexrelid
+                JOIN pg_namespace n ON n.oid = t.relnamespace
+                JOIN pg_am am ON i.relam = am.oid
+                CROSS JOIN LATERAL unnest(ix.indkey) WITH ORDINALITY AS k(attnum, pos)
+                JOIN pg_attribute a ON a.attrelid = t.oid AND a.attnum = k.attnum
+                WHERE n.nspname = %s {table_filter}
+                GROUP BY t.relname, i.relname, am.amname, ix.indisunique, ix.indisprimary
+                ORDER BY t.relname, i.relname
+            """, params)
+            
+            result = {table_name: {}} if table_name else {}
+            for table, index_name, index_type, is_unique, is_primary, columns in cursor.fetchall():
+                result.setdefault(table, {})[index_name] = {
+                    "columns": [{"name": col, "nullable": True} for col in columns],
+                    "cardinality": 0,  # PostgreSQL doesn't provide direct cardinality
+                    "type": index_type,
+                    "unique": is_unique,
+                    "primary": is_primary
+                }
+            return result
                 
-    def explain_query(self, query: str) -> Dict:
-        """쿼리 실행 계획 분석"""
+    def explain_query(self, query: str, analyze: bool = False) -> Dict:
+        """쿼리 실행 계획 분석 (PostgreSQL은 항상 EXPLAIN ANALYZE 사용)"""
         with self.connection.cursor() as cursor:
             # EXPLAIN ANALYZE 실행
             cursor.execute(f"EXPLAIN (ANALYZE, BUFFERS, FORMAT JSON) {query}")
@@ -384,83 +613,97 @@ class PostgreSQLAdapter(DatabaseAdapter):
                 "database_type": "postgresql"
             }
             
-    def get_db_status(self) -> Dict:
-        """데이터베이스 상태 정보"""
+    def get_db_status(self, include_processes: bool = False) -> Dict:
+        """데이터베이스 상태 정보
+        
+        활성 쿼리는 최대 10개로 제한되므로 include_processes와 무관하게 항상 포함합니다.
+        버전/연결 수/데이터베이스 통계/활성 쿼리를 한 번의 쿼리로 조회합니다.
+        활성 쿼리는 json_agg 대신 컬럼별 array_agg로 모아 query_start 등의 타입을 그대로 유지합니다.
+        """
         with self.connection.cursor() as cursor:
-            # PostgreSQL 버전
-            cursor.execute("SELECT version()")
-            version = cursor.fetchone()[0]
-            
-            # 활성 연결 수
-            cursor.execute("""
-                SELECT count(*) as total_connections,
-                       count(case when state = 'active' then 1 end) as active_connections,
-                       count(case when state = 'idle' then 1 end) as idle_connections
-                FROM pg_stat_activity
-                WHERE datname = current_database()
-            """)
-            conn_stats = cursor.fetchone()
-            
-            # 데이터베이스 통계
             cursor.execute("""
                 SELECT 
-                    numbackends,
-                    xact_commit,
-                    xact_rollback,
-                    blks_read,
-                    blks_hit,
-                    tup_returned,
-                    tup_fetched,
-                    tup_inserted,
-                    tup_updated,
-                    tup_deleted
-                FROM pg_stat_database
-                WHERE datname = current_database()
+                    version(),
+                    c.total_connections,
+                    c.active_connections,
+                    c.idle_connections,
+                    d.xact_commit,
+                    d.xact_rollback,
+                    d.blks_read,
+                    d.blks_hit,
+                    q.pids,
+                    q.usenames,
+                    q.application_names,
+                    q.client_addrs,
+                    q.states,
+                    q.query_starts,
+                    q.query_previews
+                FROM (
+                    SELECT count(*) as total_connections,
+                           count(case when state = 'active' then 1 end) as active_connections,
+                           count(case when state = 'idle' then 1 end) as idle_connections
+                    FROM pg_stat_activity
+                    WHERE datname = current_database()
+                ) c
+                LEFT JOIN pg_stat_database d ON d.datname = current_database()
+                CROSS JOIN (
+                    SELECT 
+                        array_agg(pid ORDER BY rn) as pids,
+                        array_agg(usename ORDER BY rn) as usenames,
+                        array_agg(application_name ORDER BY rn) as application_names,
+                        array_agg(host(client_addr) ORDER BY rn) as client_addrs,
+                        array_agg(state ORDER BY rn) as states,
+                        array_agg(query_start ORDER BY rn) as query_starts,
+                        array_agg(query_preview ORDER BY rn) as query_previews
+                    FROM (
+                        SELECT 
+                            row_number() OVER (ORDER BY query_start) as rn,
+                            pid,
+                            usename,
+                            application_name,
+                            client_addr,
+                            state,
+                            query_start,
+                            left(query, 100) as query_preview
+                        FROM pg_stat_activity
+                        WHERE datname = current_database() AND state = 'active'
+                        ORDER BY query_start
+                        LIMIT 10
+                    ) a
+                ) q
             """)
-            db_stats = cursor.fetchone()
+            (version, total, active, idle, committed, rolled_back,
+             blocks_read, blocks_hit, *query_columns) = cursor.fetchone()
             
-            # 진행 중인 쿼리들
-            cursor.execute("""
-                SELECT 
-                    pid,
-                    usename,
-                    application_name,
-                    client_addr,
-                    state,
-                    query_start,
-                    left(query, 100) as query_preview
-                FROM pg_stat_activity
-                WHERE datname = current_database() AND state = 'active'
-                ORDER BY query_start
-                LIMIT 10
-            """)
-            active_queries = cursor.fetchall()
+            # 컬럼별 배열을 행으로 되돌려 기존과 같은 타입(query_start는 datetime, client_addr는 문자열)을 유지
+            active_queries = zip(*(column or [] for column in query_columns))
             
             return {
                 "global_status": {
                     "version": version,
-                    "total_connections": conn_stats[0] if conn_stats else 0,
-                    "active_connections": conn_stats[1] if conn_stats else 0,
-                    "idle_connections": conn_stats[2] if conn_stats else 0,
-                    "transactions_committed": db_stats[1] if db_stats else 0,
-                    "transactions_rolled_back": db_stats[2] if db_stats else 0,
-                    "blocks_read": db_stats[3] if db_stats else 0,
-                    "blocks_hit": db_stats[4] if db_stats else 0
+                    "total_connections": total or 0,
+                    "active_connections": active or 0,
+                    "idle_connections": idle or 0,
+                    "transactions_committed": committed or 0,
+                    "transactions_rolled_back": rolled_back or 0,
+                    "blocks_read": blocks_read or 0,
+                    "blocks_hit": blocks_hit or 0
                 },
                 "connection_stats": {
-                    "total": conn_stats[0] if conn_stats else 0,
-                    "active": conn_stats[1] if conn_stats else 0,
-                    "idle": conn_stats[2] if conn_stats else 0
+                    "total": total or 0,
+                    "active": active or 0,
+                    "idle": idle or 0
                 },
                 "active_queries": [
                     {
-                        "pid": q[0],
-                        "user": q[1],
-                        "application": q[2],
-                        "client_addr": str(q[3]) if q[3] else None,
-                        "state": q[4],
-                        "query_start": q[5],
-                        "query_preview": q[6]
-                    } for q in active_queries
+                        "pid": pid,
+                        "user": user,
+                        "application": application,
+                        "client_addr": client_addr,
+                        "state": state,
+                        "query_start": query_start,
+                        "query_preview": query_preview
+                    } for (pid, user, application, client_addr, state,
+                           query_start, query_preview) in active_queries
                 ]
-            } 
\ No newline at end of file
+            }
\ No newline at end of file
@@ -8,6 +8,9 @@ import logging
 import sys
 from dotenv import load_dotenv
 
+# .env 로드 (어댑터 모듈이 임포트 시점에 환경변수를 읽으므로 임포트보다 먼저 수행)
+load_dotenv()
+
 # 모듈 임포트
 from adapters import get_adapter
 from tools.schema_tools import register_schema_tools
@@ -16,18 +19,17 @@ from tools.visualization_tools import register_visualization_tools
 
 # 로깅 설정
 logging.basicConfig(
-    level=logging.DEBUG,
+    # LOG_LEVEL 환경변수 사용 (DEBUG는 쿼리/인자 로깅 부하가 있으므로 기본값은 INFO)
+    level=getattr(logging, os.getenv("LOG_LEVEL", "INFO").upper(), logging.INFO),
     format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
     stream=sys.stderr
 )
 logger = logging.getLogger(__name__)
 
-# .env 로드
-load_dotenv()
-
-def get_db_config():
+def get_db_config(db_type: str = None):
     """환경변수에서 데이터베이스 설정을 가져옵니다."""
-    db_type = os.getenv("DB_TYPE", "mysql").lower()
+    if db_type is None:
+        db_type = os.getenv("DB_TYPE", "mysql").lower()
     
     if db_type == "mysql":
         return {
@@ -58,10 +60,11 @@ def create_mcp_server():
     """MCP 서버를 생성하고 설정합니다."""
     # 데이터베이스 설정
     db_type = os.getenv("DB_TYPE", "mysql").lower()
-    db_config = get_db_config()
+    db_config = get_db_config(db_type)
     
     logger.info(f"MCP 서버 시작 - DB 타입: {db_type}")
-    logger.info(f"데이터베이스 설정: {db_config}")
+    # 비밀번호는 로그에 남기지 않음
+    logger.info("데이터베이스 설정: %s", {k: ("***" if k == "password" else v) for k, v in db_config.items()})
     
     # MCP 서버 생성 (stdio 모드)
     mcp = FastMCP(
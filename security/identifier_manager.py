@@ -3,21 +3,51 @@
 """
 
 import logging
-from typing import Set, Dict, List, Optional
+import re
+import threading
+import time
+from functools import lru_cache
+from typing import Set, Dict, List, Optional, Callable
 from .query_validator import QueryValidator, SecurityError
 
 logger = logging.getLogger(__name__)
 
+# 이스케이프 없이 그대로 인용 가능한 일반 식별자 패턴
+_IDENT_RE = re.compile(r'^[A-Za-z0-9_$]+$')
+
+# DB 타입별 식별자 인용부호
+_QUOTE_CHARS = {"mysql": "`", "postgresql": '"'}
+
+
+@lru_cache(maxsize=4096)
+def quote_identifier(identifier: str, db_type: str = "mysql") -> str:
+    """식별자 인용부호 처리 (인용부호 문자는 두 번 써서 이스케이프, 결과 캐시)"""
+    quote = _QUOTE_CHARS.get(db_type.lower())
+    if quote is None:
+        return identifier
+    if not _IDENT_RE.match(identifier):
+        identifier = identifier.replace(quote, quote * 2)
+    return f"{quote}{identifier}{quote}"
+
 class IdentifierManager:
     """식별자 화이트리스트 관리자"""
     
-    def __init__(self, validator: QueryValidator = None):
+    def __init__(self, validator: QueryValidator = None, schema_loader: Optional[Callable[[], None]] = None,
+                 cache_ttl: Optional[float] = None):
         self.validator = validator or QueryValidator()
         self._table_whitelist: Set[str] = set()
         self._column_whitelist: Dict[str, Set[str]] = {}  # table_name -> set of columns
         self._schema_cache: Dict[str, Dict] = {}
         self._cache_valid = False
         
+        # 최초 검증 시 스키마 캐시를 채우는 지연 로더 (없으면 load_schema_cache() 명시 호출 필요)
+        self._schema_loader = schema_loader
+        self._load_lock = threading.Lock()
+        
+        # 화이트리스트 유효 시간 (초, 지연 로더가 있을 때만 만료 후 재로딩). None이면 만료 없음
+        self._cache_ttl = cache_ttl
+        self._loaded_at = 0.0
+        
     def load_schema_cache(self, adapter) -> None:
         """스키마 캐시 로드"""
         try:
@@ -25,34 +55,56 @@ class IdentifierManager:
             
             # 테이블 목록 로드
             tables = adapter.get_tables()
-            self._table_whitelist = set(tables)
             
-            # 각 테이블의 컬럼 정보 로드
+            # 전체 테이블의 컬럼 정보를 일괄 로드 (테이블별 N+1 조회 방지)
+            # 실패 시 빈 컬럼 화이트리스트를 캐시하지 않도록 기존 캐시를 건드리기 전에 예외를 전파
+            # (캐시 유효 상태와 로드 시각이 갱신되지 않으므로 다음 검증 시 다시 로드)
+            schemas = adapter.get_table_schema_bulk(tables)
+            
+            # 외래키 정보는 스키마 캐시에만 쓰이므로 실패해도 컬럼 화이트리스트는 유지
+            try:
+                foreign_keys = adapter.get_foreign_keys_bulk(tables)
+            except Exception as e:
+                logger.warning(f"외래키 일괄 로드 실패: {e}")
+                foreign_keys = {}
+                
+            self._table_whitelist = set(tables)
             self._column_whitelist.clear()
             for table in tables:
-                try:
-                    schema = adapter.get_table_schema(table)
-                    columns = {col['name'] for col in schema}
-                    self._column_whitelist[table] = columns
-                    
-                    # 스키마 캐시에도 저장
-                    self._schema_cache[table] = {
-                        'columns': schema,
-                        'foreign_keys': adapter.get_foreign_keys(table)
-                    }
-                except Exception as e:
-                    logger.warning(f"테이블 '{table}' 스키마 로드 실패: {e}")
-                    self._column_whitelist[table] = set()
+                schema = schemas.get(table, [])
+                self._column_whitelist[table] = {col['name'] for col in schema}
+                
+                # 스키마 캐시에도 저장
+                self._schema_cache[table] = {
+                    'columns': schema,
+                    'foreign_keys': foreign_keys.get(table, [])
+                }
                     
             self._cache_valid = True
+            self._loaded_at = time.monotonic()
             logger.info(f"스키마 캐시 로드 완료: {len(tables)}개 테이블")
             
         except Exception as e:
             logger.error(f"스키마 캐시 로드 실패: {e}")
             raise
             
+    def _is_expired(self) -> bool:
+        """화이트리스트 유효 시간 경과 여부"""
+        return self._cache_ttl is not None and time.monotonic() - self._loaded_at >= self._cache_ttl
+        
+    def _ensure_loaded(self) -> None:
+        """스키마 캐시가 없거나 유효 시간이 지났으면 지연 로더로 (다시) 로드"""
+        if self._schema_loader is None or (self._cache_valid and not self._is_expired()):
+            return
+            
+        with self._load_lock:
+            if not self._cache_valid or self._is_expired():
+                self._schema_loader()
+                self._loaded_at = time.monotonic()
+                
     def validate_table_name(self, table_name: str) -> bool:
         """테이블명 검증"""
+        self._ensure_loaded()
         if not self._cache_valid:
             raise SecurityError(
                 "스키마 캐시가 로드되지 않았습니다. 먼저 load_schema_cache()를 호출하세요.",
@@ -92,14 +144,34 @@ class IdentifierManager:
         # 기본 식별자 검증
         return self.validator.validate_identifier(column_name)
         
+    def validate_column_names(self, table_name: str, column_names: List[str]) -> bool:
+        """여러 컬럼명 일괄 검증 (테이블 검증과 화이트리스트 조회는 한 번만 수행)"""
+        # 먼저 테이블명 검증
+        self.validate_table_name(table_name)
+        
+        # 컬럼 화이트리스트 검증
+        allowed = self._column_whitelist.get(table_name)
+        if allowed is None:
+            raise SecurityError(
+                f"테이블 '{table_name}'의 컬럼 정보를 찾을 수 없습니다.",
+                error_code="TABLE_COLUMNS_NOT_FOUND"
+            )
+            
+        for column_name in column_names:
+            if column_name not in allowed:
+                raise SecurityError(
+                    f"테이블 '{table_name}'에 컬럼 '{column_name}'이 존재하지 않습니다.",
+                    error_code="COLUMN_NOT_WHITELISTED",
+                    available_columns=list(allowed)
+                )
+                
+            # 기본 식별자 검증
+            self.validator.validate_identifier(column_name)
+        return True
+        
     def get_safe_identifier(self, identifier: str, db_type: str = "mysql") -> str:
         """안전한 식별자 인용부호 처리"""
-        if db_type.lower() == "mysql":
-            return f"`{identifier}`"
-        elif db_type.lower() == "postgresql":
-            return f'"{identifier}"'
-        else:
-            return identifier
+        return quote_identifier(identifier, db_type)
             
     def get_table_schema(self, table_name: str) -> Dict:
         """테이블 스키마 정보 반환"""
@@ -108,6 +180,7 @@ class IdentifierManager:
         
     def get_available_tables(self) -> List[str]:
         """사용 가능한 테이블 목록 반환"""
+        self._ensure_loaded()
         return list(self._table_whitelist)
         
     def get_available_columns(self, table_name: str) -> List[str]:
@@ -8,11 +8,75 @@ SQL 쿼리 보안 검증기
 
 import re
 import logging
+from functools import lru_cache
 from typing import List, Set, Optional
 from enum import Enum
 
 logger = logging.getLogger(__name__)
 
+# SELECT로 시작하는지 확인 (앞쪽 공백 허용, 대소문자 구분 없음) - 쿼리 전체를 대문자로 복사하지 않음
+_SELECT_START_RE = re.compile(r'\s*SELECT', re.IGNORECASE)
+
+# 주석/문자열 리터럴 토큰 패턴 - 왼쪽부터 한 번에 스캔하므로 문자열 안의 '--'나
+# 주석 안의 따옴표를 잘못 해석하지 않음
+# MySQL 실행 주석(/*!버전 ... */)은 별도 토큰으로 구분 (MySQL은 내용을 실행, 그 외 DB는 일반 주석)
+_COMMENT_TOKEN_PATTERN = (
+    r"(?P<executable>/\*!\d*(?P<executable_body>.*?)\*/)"
+    r"|(?P<comment>--[^\n]*|/\*.*?\*/)"
+)
+
+# 인용 규칙은 DB마다 다르므로 DB별 토큰 패턴을 사용
+# - MySQL: 문자열('...', "...")은 백슬래시 이스케이프 허용, 백틱 식별자는 ``만 이스케이프
+# - PostgreSQL: standard_conforming_strings(기본값 on) 기준으로 '...'와 "..."는 겹따옴표만
+#   이스케이프하고, 백슬래시 이스케이프는 E'...' 문자열에서만 허용
+#   (식별자에 붙은 E는 E 문자열 접두사가 아님)
+# 겹따옴표('', "", ``)는 인접한 두 토큰으로 매칭되므로 별도 처리가 필요 없음
+_LEXICAL_TOKEN_RES = {
+    "mysql": re.compile(
+        _COMMENT_TOKEN_PATTERN
+        + r"|(?P<single>'(?:[^'\\]|\\.)*')"
+        + r'|(?P<double>"(?:[^"\\]|\\.)*")'
+        + r"|(?P<backtick>`[^`]*`)",
+        re.DOTALL
+    ),
+    "postgresql": re.compile(
+        _COMMENT_TOKEN_PATTERN
+        + r"|(?P<single>(?<![\w$])[Ee]'(?:[^'\\]|\\.)*'|'[^']*')"
+        + r'|(?P<double>"[^"]*")',
+        re.DOTALL
+    ),
+}
+
+
+def _lexical_token_re(db_type: str) -> re.Pattern:
+    """DB 타입에 맞는 토큰 패턴 (알 수 없는 타입은 MySQL 규칙 사용)"""
+    return _LEXICAL_TOKEN_RES.get(db_type, _LEXICAL_TOKEN_RES["mysql"])
+
+
+# 문자열 리터럴을 대체할 빈 리터럴
+_EMPTY_LITERALS = {'single': "''", 'double': '""', 'backtick': '``'}
+
+# 인용 문자 (실행 주석 내 사용 금지)
+_QUOTE_CHARS = frozenset("'\"`")
+
+# 식별자 SQL 주입 시도 패턴 (하나의 정규식으로 결합해 한 번만 검색)
+_IDENTIFIER_DANGEROUS_RE = re.compile(
+    '|'.join((
+        r'[;\'"`]',  # 구분자 및 따옴표
+        r'--',       # 주석
+        r'/\*',      # 블록 주석 시작
+        r'\*/',      # 블록 주석 끝
+        r'\b(?:UNION|SELECT|INSERT|UPDATE|DELETE|DROP|ALTER|CREATE)\b',  # SQL 키워드
+        r'\.\.',     # 디렉토리 탐색
+        r'%',        # 와일드카드
+        r'_',        # 단일 문자 와일드카드
+    )),
+    re.IGNORECASE
+)
+
+# 식별자 허용 문자 패턴
+_IDENTIFIER_CHARS_RE = re.compile(r'^[a-zA-Z_][a-zA-Z0-9_]*$')
+
 class SecurityLevel(Enum):
     """보안 수준"""
     STRICT = "strict"      # 모든 검증 강제
@@ -23,7 +87,7 @@ class QueryValidator:
     """SQL 쿼리 보안 검증기"""
     
     # 금지된 SQL 동사들 (대소문자 구분 없음)
-    FORBIDDEN_VERBS = {
+    FORBIDDEN_VERBS = frozenset({
         'INSERT', 'UPDATE', 'DELETE', 'DROP', 'ALTER', 'CREATE', 'TRUNCATE',
         'GRANT', 'REVOKE', 'COPY', 'LOAD', 'CALL', 'MERGE', 'VACUUM', 
         'ANALYZE', 'COMMENT', 'SET', 'SHOW', 'USE', 'PREPARE', 'EXECUTE',
@@ -31,7 +95,17 @@ class QueryValidator:
         'RESET', 'KILL', 'SHUTDOWN', 'RESTART', 'RELOAD', 'REPAIR',
         'OPTIMIZE', 'CHECK', 'CHECKSUM', 'BACKUP', 'RESTORE', 'IMPORT',
         'EXPORT', 'DUMP', 'LOAD_FILE', 'INTO', 'OUTFILE', 'INFILE'
-    }
+    })
+    
+    # 문자열 리터럴 검사용 소문자 금지 동사
+    _FORBIDDEN_VERBS_LOWER = tuple(verb.lower() for verb in FORBIDDEN_VERBS)
+    
+    # 금지 동사 전체를 하나의 교대(alternation) 정규식으로 결합 - 쿼리를 한 번만 스캔
+    # (긴 동사를 먼저 두어 같은 위치에서 더 긴 동사가 우선 매칭되도록 함)
+    _FORBIDDEN_VERB_RE = re.compile(
+        r'\b(?:' + '|'.join(re.escape(verb) for verb in sorted(FORBIDDEN_VERBS, key=len, reverse=True)) + r')\b',
+        re.IGNORECASE
+    )
     
     # MySQL 특화 위험 키워드
     MYSQL_DANGEROUS_KEYWORDS = {
@@ -44,10 +118,21 @@ class QueryValidator:
         'COPY FROM', 'COPY TO', '\\COPY', '\\lo_import', '\\lo_export'
     }
     
+    # 대문자 변환을 미리 해 둔 (원본, 대문자) 키워드 쌍
+    _MYSQL_DANGEROUS_UPPER = tuple((keyword, keyword.upper()) for keyword in MYSQL_DANGEROUS_KEYWORDS)
+    _POSTGRESQL_DANGEROUS_UPPER = tuple((keyword, keyword.upper()) for keyword in POSTGRESQL_DANGEROUS_KEYWORDS)
+    
+    # 검증 통과 결과 캐시 크기 (실패한 검증은 캐시하지 않음)
+    VALIDATION_CACHE_SIZE = 2048
+    
     def __init__(self, security_level: SecurityLevel = SecurityLevel.STRICT):
         self.security_level = security_level
         self.read_only_mode = True  # 기본적으로 읽기 전용
         
+        # 파라미터는 별도로 바인딩되므로 쿼리 문자열 단위로 검증 결과를 재사용
+        self._validate_query_cached = lru_cache(maxsize=self.VALIDATION_CACHE_SIZE)(self._validate_query_uncached)
+        self._validate_identifier_cached = lru_cache(maxsize=self.VALIDATION_CACHE_SIZE)(self._validate_identifier_uncached)
+        
     def validate_query(self, query: str, db_type: str = "mysql") -> bool:
         """
         SQL 쿼리 보안 검증
@@ -65,48 +150,64 @@ class QueryValidator:
         if not query or not query.strip():
             raise SecurityError("빈 쿼리는 허용되지 않습니다.")
             
-        # 1. 세미콜론을 통한 다중 문장 실행 차단
-        self._validate_single_statement(query)
-        
-        # 2. 금지 동사 검증 (읽기 전용 검증보다 먼저)
-        self._validate_forbidden_verbs(query)
-        
-        # 3. 기본 읽기 전용 검증
-        if self.read_only_mode:
-            self._validate_read_only(query)
-        
-        # 4. DB별 위험 키워드 검증
-        if db_type.lower() == "mysql":
-            self._validate_mysql_dangerous_keywords(query)
-        elif db_type.lower() == "postgresql":
-            self._validate_postgresql_dangerous_keywords(query)
+        return self._validate_query_cached(query, db_type.lower(), self.read_only_mode)
+        
+    def clear_validation_cache(self) -> None:
+        """검증 결과 캐시 초기화"""
+        self._validate_query_cached.cache_clear()
+        self._validate_identifier_cached.cache_clear()
+        
+    def _validate_query_uncached(self, query: str, db_type: str, read_only_mode: bool) -> bool:
+        """SQL 쿼리 보안 검증 (캐시 미적용)"""
+        # MySQL 실행 주석은 서버 버전에 따라 실행되거나 주석으로 무시되므로
+        # 따옴표를 금지한 뒤 두 해석(내용 실행 / 주석 제거)을 모두 검증
+        keep_executable_forms = (False,)
+        if db_type == "mysql" and '/*!' in query:
+            self._validate_executable_comments(query, db_type)
+            keep_executable_forms = (False, True)
+            
+        for keep_executable in keep_executable_forms:
+            # 문자열 리터럴/주석 제거는 해석별로 한 번만 수행하고 각 검증 단계에서 공유
+            clean_query = self._strip_strings_and_comments(query, db_type, keep_executable)
+            
+            # 1. 세미콜론을 통한 다중 문장 실행 차단
+            self._validate_single_statement(clean_query)
             
-        # 5. 주석을 통한 우회 시도 차단
-        self._validate_comment_bypass(query)
+            # 2. 금지 동사 검증 (읽기 전용 검증보다 먼저)
+            self._validate_forbidden_verbs(clean_query)
+            
+            # 3. 기본 읽기 전용 검증
+            if read_only_mode:
+                self._validate_read_only(clean_query)
+            
+            # 4. DB별 위험 키워드 검증
+            if db_type == "mysql":
+                self._validate_mysql_dangerous_keywords(clean_query)
+            elif db_type == "postgresql":
+                self._validate_postgresql_dangerous_keywords(clean_query)
+                
+            # 5. 주석을 통한 우회 시도 차단
+            self._validate_comment_bypass(self._strip_comments(query, db_type, keep_executable))
         
         # 6. 문자열 리터럴 내 위험 패턴 검증
-        self._validate_string_literals(query)
+        self._validate_string_literals(query, db_type)
         
-        logger.info(f"쿼리 보안 검증 통과: {query[:50]}...")
+        # 검증마다 실행되는 로그이므로 로그 레벨이 꺼져 있으면 문자열 생성 생략
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("쿼리 보안 검증 통과: %s...", query[:50])
         return True
         
-    def _validate_read_only(self, query: str) -> None:
-        """읽기 전용 모드 검증"""
-        # 문자열 리터럴과 주석을 제거한 후 검증
-        clean_query = self._strip_strings_and_comments(query)
-        
+    def _validate_read_only(self, clean_query: str) -> None:
+        """읽기 전용 모드 검증 (문자열 리터럴과 주석이 제거된 쿼리)"""
         # SELECT로 시작하는지 확인 (대소문자 구분 없음)
-        if not clean_query.strip().upper().startswith('SELECT'):
+        if not _SELECT_START_RE.match(clean_query):
             raise SecurityError(
                 "읽기 전용 모드에서는 SELECT 쿼리만 허용됩니다.",
                 error_code="READ_ONLY_VIOLATION"
             )
             
-    def _validate_single_statement(self, query: str) -> None:
-        """단일 문장 실행 검증"""
-        # 문자열 리터럴과 주석을 제거
-        clean_query = self._strip_strings_and_comments(query)
-        
+    def _validate_single_statement(self, clean_query: str) -> None:
+        """단일 문장 실행 검증 (문자열 리터럴과 주석이 제거된 쿼리)"""
         # 세미콜론 개수 확인
         semicolon_count = clean_query.count(';')
         if semicolon_count > 1:
@@ -122,130 +223,111 @@ class QueryValidator:
                 error_code="INVALID_SEMICOLON_POSITION"
             )
             
-    def _validate_forbidden_verbs(self, query: str) -> None:
-        """금지된 SQL 동사 검증"""
-        # 문자열 리터럴과 주석을 제거
-        clean_query = self._strip_strings_and_comments(query)
-        
-        # 단어 경계를 고려한 패턴 매칭
-        for verb in self.FORBIDDEN_VERBS:
-            # 단어 경계를 고려한 정규식
-            pattern = r'\b' + re.escape(verb) + r'\b'
-            if re.search(pattern, clean_query, re.IGNORECASE):
-                raise SecurityError(
-                    f"금지된 SQL 동사 '{verb}'가 감지되었습니다.",
-                    error_code="FORBIDDEN_VERB",
-                    detected_verb=verb
-                )
+    def _validate_forbidden_verbs(self, clean_query: str) -> None:
+        """금지된 SQL 동사 검증 (문자열 리터럴과 주석이 제거된 쿼리)"""
+        # 단어 경계를 고려한 패턴 매칭 (결합된 정규식으로 단일 스캔)
+        match = self._FORBIDDEN_VERB_RE.search(clean_query)
+        if match:
+            verb = match.group().upper()
+            raise SecurityError(
+                f"금지된 SQL 동사 '{verb}'가 감지되었습니다.",
+                error_code="FORBIDDEN_VERB",
+                detected_verb=verb
+            )
                 
-    def _validate_mysql_dangerous_keywords(self, query: str) -> None:
-        """MySQL 위험 키워드 검증"""
-        clean_query = self._strip_strings_and_comments(query)
+    def _validate_mysql_dangerous_keywords(self, clean_query: str) -> None:
+        """MySQL 위험 키워드 검증 (문자열 리터럴과 주석이 제거된 쿼리)"""
+        # 쿼리는 한 번만 대문자로 변환
+        clean_upper = clean_query.upper()
         
-        for keyword in self.MYSQL_DANGEROUS_KEYWORDS:
-            if keyword.upper() in clean_query.upper():
+        for keyword, keyword_upper in self._MYSQL_DANGEROUS_UPPER:
+            if keyword_upper in clean_upper:
                 raise SecurityError(
                     f"MySQL 위험 키워드 '{keyword}'가 감지되었습니다.",
                     error_code="MYSQL_DANGEROUS_KEYWORD",
                     detected_keyword=keyword
                 )
                 
-    def _validate_postgresql_dangerous_keywords(self, query: str) -> None:
-        """PostgreSQL 위험 키워드 검증"""
-        clean_query = self._strip_strings_and_comments(query)
+    def _validate_postgresql_dangerous_keywords(self, clean_query: str) -> None:
+        """PostgreSQL 위험 키워드 검증 (문자열 리터럴과 주석이 제거된 쿼리)"""
+        # 쿼리는 한 번만 대문자로 변환
+        clean_upper = clean_query.upper()
         
-        for keyword in self.POSTGRESQL_DANGEROUS_KEYWORDS:
-            if keyword.upper() in clean_query.upper():
+        for keyword, keyword_upper in self._POSTGRESQL_DANGEROUS_UPPER:
+            if keyword_upper in clean_upper:
                 raise SecurityError(
                     f"PostgreSQL 위험 키워드 '{keyword}'가 감지되었습니다.",
                     error_code="POSTGRESQL_DANGEROUS_KEYWORD",
                     detected_keyword=keyword
                 )
                 
-    def _validate_comment_bypass(self, query: str) -> None:
-        """주석을 통한 우회 시도 검증"""
-        # 주석을 제거한 후 다시 검증
-        clean_query = self._strip_comments(query)
-        
+    def _validate_comment_bypass(self, clean_query: str) -> None:
+        """주석을 통한 우회 시도 검증 (주석만 제거된 쿼리)"""
         # 주석 제거 후에도 금지 동사가 있는지 확인 (SELECT가 아닌 경우만)
-        if not clean_query.strip().upper().startswith('SELECT'):
-            for verb in self.FORBIDDEN_VERBS:
-                pattern = r'\b' + re.escape(verb) + r'\b'
-                if re.search(pattern, clean_query, re.IGNORECASE):
-                    raise SecurityError(
-                        f"주석을 통한 우회 시도가 감지되었습니다. 금지된 동사: '{verb}'",
-                        error_code="COMMENT_BYPASS_ATTEMPT",
-                        detected_verb=verb
-                    )
+        if not _SELECT_START_RE.match(clean_query):
+            match = self._FORBIDDEN_VERB_RE.search(clean_query)
+            if match:
+                verb = match.group().upper()
+                raise SecurityError(
+                    f"주석을 통한 우회 시도가 감지되었습니다. 금지된 동사: '{verb}'",
+                    error_code="COMMENT_BYPASS_ATTEMPT",
+                    detected_verb=verb
+                )
                 
-    def _validate_string_literals(self, query: str) -> None:
+    def _validate_string_literals(self, query: str, db_type: str = "mysql") -> None:
         """문자열 리터럴 내 위험 패턴 검증"""
         # 문자열 리터럴 추출
-        string_literals = self._extract_string_literals(query)
+        string_literals = self._extract_string_literals(query, db_type)
         
         for literal in string_literals:
-            # 문자열 내에서도 위험한 패턴 검사
-            if any(verb.lower() in literal.lower() for verb in self.FORBIDDEN_VERBS):
+            # 문자열 내에서도 위험한 패턴 검사 (리터럴은 한 번만 소문자로 변환)
+            literal_lower = literal.lower()
+            if any(verb in literal_lower for verb in self._FORBIDDEN_VERBS_LOWER):
                 # 단, 이는 false positive일 수 있으므로 경고만
                 logger.warning(f"문자열 리터럴 내에서 의심스러운 패턴 감지: {literal[:50]}...")
                 
-    def _strip_strings_and_comments(self, query: str) -> str:
-        """문자열 리터럴과 주석을 제거"""
-        # 1. 주석 제거
-        clean_query = self._strip_comments(query)
-        
-        # 2. 문자열 리터럴 제거
-        clean_query = self._strip_string_literals(clean_query)
-        
-        return clean_query
-        
-    def _strip_comments(self, query: str) -> str:
-        """SQL 주석 제거"""
-        # -- 주석 제거
-        lines = query.split('\n')
-        clean_lines = []
+    def _validate_executable_comments(self, query: str, db_type: str = "mysql") -> None:
+        """MySQL 실행 주석 검증 - 내용에 따옴표가 있으면 주석/문자열 경계 해석이 달라지므로 차단"""
+        for match in _lexical_token_re(db_type).finditer(query):
+            if match.lastgroup == 'executable' and not _QUOTE_CHARS.isdisjoint(match.group('executable_body')):
+                raise SecurityError(
+                    "MySQL 실행 주석(/*! */) 내 따옴표는 허용되지 않습니다.",
+                    error_code="EXECUTABLE_COMMENT_QUOTE"
+                )
+                
+    def _strip_strings_and_comments(self, query: str, db_type: str = "mysql", keep_executable: bool = False) -> str:
+        """문자열 리터럴과 주석을 제거 (단일 패스)
         
-        for line in lines:
-            # -- 주석 제거
-            if '--' in line:
-                line = line[:line.index('--')]
-            clean_lines.append(line)
+        Args:
+            db_type: 데이터베이스 타입 (인용/이스케이프 규칙 결정)
+            keep_executable: True이면 MySQL 실행 주석의 내용을 남김 (실행되는 경우의 해석)
+        """
+        def replace(match):
+            kind = match.lastgroup
+            if kind == 'executable':
+                return f" {match.group('executable_body')} " if keep_executable else ''
+            return _EMPTY_LITERALS.get(kind, '')
+            
+        return _lexical_token_re(db_type).sub(replace, query)
+        
+    def _strip_comments(self, query: str, db_type: str = "mysql", keep_executable: bool = False) -> str:
+        """SQL 주석 제거 (문자열 리터럴은 유지)"""
+        def replace(match):
+            kind = match.lastgroup
+            if kind == 'executable':
+                return f" {match.group('executable_body')} " if keep_executable else ''
+            return '' if kind == 'comment' else match.group()
+            
+        return _lexical_token_re(db_type).sub(replace, query)
+        
+    def _extract_string_literals(self, query: str, db_type: str = "mysql") -> List[str]:
+        """문자열 리터럴 추출 (주석 안의 따옴표는 제외)"""
+        return [
+            match.group().lstrip('Ee')[1:-1]
+            for match in _lexical_token_re(db_type).finditer(query)
+            if match.lastgroup not in ('comment', 'executable')
+        ]
             
-        clean_query = '\n'.join(clean_lines)
-        
-        # /* */ 주석 제거
-        clean_query = re.sub(r'/\*.*?\*/', '', clean_query, flags=re.DOTALL)
-        
-        return clean_query
-        
-    def _strip_string_literals(self, query: str) -> str:
-        """문자열 리터럴 제거"""
-        # 작은따옴표 문자열 제거
-        clean_query = re.sub(r"'([^'\\]|\\.)*'", "''", query)
-        
-        # 큰따옴표 문자열 제거 (MySQL/PostgreSQL)
-        clean_query = re.sub(r'"([^"\\]|\\.)*"', '""', clean_query)
-        
-        # 백틱 문자열 제거 (MySQL)
-        clean_query = re.sub(r'`([^`\\]|\\.)*`', '``', clean_query)
-        
-        return clean_query
-        
-    def _extract_string_literals(self, query: str) -> List[str]:
-        """문자열 리터럴 추출"""
-        literals = []
-        
-        # 작은따옴표 문자열
-        literals.extend(re.findall(r"'([^'\\]|\\.)*'", query))
-        
-        # 큰따옴표 문자열
-        literals.extend(re.findall(r'"([^"\\]|\\.)*"', query))
-        
-        # 백틱 문자열
-        literals.extend(re.findall(r'`([^`\\]|\\.)*`', query))
-        
-        return literals
-        
     def validate_identifier(self, identifier: str, allowed_identifiers: Optional[Set[str]] = None) -> bool:
         """
         식별자(테이블명, 컬럼명) 검증
@@ -272,6 +354,11 @@ class QueryValidator:
                 error_code="IDENTIFIER_NOT_WHITELISTED"
             )
             
+        # 2~3. 형식/위험 패턴 검증 (식별자 단위 캐시)
+        return self._validate_identifier_cached(identifier)
+        
+    def _validate_identifier_uncached(self, identifier: str) -> bool:
+        """식별자 형식/패턴 검증 (캐시 미적용)"""
         # 2. 기본 식별자 검증
         self._validate_identifier_format(identifier)
         
@@ -282,25 +369,14 @@ class QueryValidator:
         
     def _validate_identifier_format(self, identifier: str) -> None:
         """식별자 형식 검증"""
-        # SQL 주입 시도 패턴 검증
-        dangerous_patterns = [
-            r'[;\'"`]',  # 구분자 및 따옴표
-            r'--',       # 주석
-            r'/\*',      # 블록 주석 시작
-            r'\*/',      # 블록 주석 끝
-            r'\b(UNION|SELECT|INSERT|UPDATE|DELETE|DROP|ALTER|CREATE)\b',  # SQL 키워드
-            r'\.\.',     # 디렉토리 탐색
-            r'%',        # 와일드카드
-            r'_',        # 단일 문자 와일드카드
-        ]
-        
-        for pattern in dangerous_patterns:
-            if re.search(pattern, identifier, re.IGNORECASE):
-                raise SecurityError(
-                    f"식별자에 위험한 패턴이 감지되었습니다: {identifier}",
-                    error_code="DANGEROUS_IDENTIFIER_PATTERN",
-                    detected_pattern=pattern
-                )
+        # SQL 주입 시도 패턴 검증 (결합된 정규식으로 단일 검색)
+        match = _IDENTIFIER_DANGEROUS_RE.search(identifier)
+        if match:
+            raise SecurityError(
+                f"식별자에 위험한 패턴이 감지되었습니다: {identifier}",
+                error_code="DANGEROUS_IDENTIFIER_PATTERN",
+                detected_pattern=match.group()
+            )
                 
     def _validate_identifier_patterns(self, identifier: str) -> None:
         """식별자 패턴 검증"""
@@ -319,7 +395,7 @@ class QueryValidator:
             )
             
         # 특수문자만으로 구성된 식별자
-        if not re.match(r'^[a-zA-Z_][a-zA-Z0-9_]*$', identifier):
+        if not _IDENTIFIER_CHARS_RE.match(identifier):
             raise SecurityError(
                 "식별자는 영문자, 숫자, 언더스코어만 허용됩니다.",
                 error_code="INVALID_IDENTIFIER_CHARACTERS"
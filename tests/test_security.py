@@ -147,7 +147,59 @@ class TestQueryValidator(unittest.TestCase):
             with self.subTest(query=query):
                 # 주석이 제거되어 SELECT 쿼리로 인식되므로 통과해야 함
                 self.assertTrue(self.validator.validate_query(query, "mysql"))
-                
+
+        # MySQL 실행 주석(/*! */) 내용은 서버에서 실행되므로 차단되어야 함
+        executable_comment_queries = [
+            "SELECT * FROM users /*! ; DROP TABLE users */",
+            "SELECT * FROM users /*!50000 UNION SELECT * FROM mysql.user INTO OUTFILE '/tmp/x' */"
+        ]
+
+        for query in executable_comment_queries:
+            with self.subTest(query=query):
+                with self.assertRaises(SecurityError):
+                    self.validator.validate_query(query, "mysql")
+
+        # 실행 주석 안의 따옴표로 주석/문자열 경계를 어긋나게 하는 우회는 모든 DB에서 차단되어야 함
+        quote_desync_queries = [
+            "SELECT 1 /*! ' */ ; DROP TABLE users; -- '",
+            "SELECT 1 /*!99999 ' */ INTO OUTFILE '/tmp/x' -- ' */"
+        ]
+
+        for query in quote_desync_queries:
+            for db_type in ("mysql", "postgresql"):
+                with self.subTest(query=query, db_type=db_type):
+                    with self.assertRaises(SecurityError):
+                        self.validator.validate_query(query, db_type)
+
+        # 따옴표 없는 옵티마이저 힌트 실행 주석은 허용
+        self.assertTrue(self.validator.validate_query("SELECT /*!40001 SQL_NO_CACHE */ * FROM users", "mysql"))
+
+    def test_dialect_escape_rules(self):
+        """DB별 이스케이프 규칙 테스트 (백슬래시로 인용 경계를 어긋나게 하는 우회 차단)"""
+        # 백틱 식별자와 PostgreSQL 표준 문자열/식별자는 백슬래시 이스케이프가 없음
+        escape_bypass_queries = [
+            ("SELECT 1 AS `\\` INTO OUTFILE '/tmp/x' -- `", "mysql"),
+            ("SELECT `\\`, LOAD_FILE('/etc/passwd') -- ` FROM t", "mysql"),
+            ("SELECT '\\'; DROP TABLE t; --'", "postgresql"),
+            ('SELECT 1 AS "\\"; DROP TABLE t; --"', "postgresql")
+        ]
+
+        for query, db_type in escape_bypass_queries:
+            with self.subTest(query=query, db_type=db_type):
+                with self.assertRaises(SecurityError):
+                    self.validator.validate_query(query, db_type)
+
+        # 각 DB에서 유효한 이스케이프는 허용
+        escaped_queries = [
+            ("SELECT * FROM users WHERE name = 'it\\'s; DROP'", "mysql"),
+            ("SELECT * FROM users WHERE name = 'it''s; DROP'", "postgresql"),
+            ("SELECT * FROM users WHERE name = E'it\\'s; DROP'", "postgresql")
+        ]
+
+        for query, db_type in escaped_queries:
+            with self.subTest(query=query, db_type=db_type):
+                self.assertTrue(self.validator.validate_query(query, db_type))
+
     def test_case_insensitive_detection(self):
         """대소문자 구분 없는 금지 동사 탐지 테스트"""
         case_variations = [
@@ -176,6 +228,40 @@ class TestQueryValidator(unittest.TestCase):
             with self.subTest(query=query):
                 self.assertTrue(self.validator.validate_query(query, "mysql"))
 
+        # 문자열 안의 주석 기호로 뒤쪽 문장을 숨길 수 없어야 함
+        hidden_queries = [
+            "SELECT '--'; DROP TABLE users;",
+            "SELECT '/*' FROM users WHERE 1 = 1; DELETE FROM users; SELECT '*/'"
+        ]
+
+        for query in hidden_queries:
+            with self.subTest(query=query):
+                with self.assertRaises(SecurityError):
+                    self.validator.validate_query(query, "mysql")
+
+    def test_validation_cache(self):
+        """검증 결과 캐시 테스트"""
+        query = "SELECT id, name FROM users WHERE id = %s"
+        
+        # 동일 쿼리 재검증은 캐시 사용
+        self.assertTrue(self.validator.validate_query(query, "mysql"))
+        self.assertTrue(self.validator.validate_query(query, "MySQL"))
+        self.assertEqual(self.validator._validate_query_cached.cache_info().hits, 1)
+        
+        # 실패한 검증은 캐시되지 않고 매번 예외 발생
+        for _ in range(2):
+            with self.assertRaises(SecurityError):
+                self.validator.validate_query("DELETE FROM users", "mysql")
+                
+        # 읽기 전용 모드 변경은 캐시 키에 반영됨
+        with self.assertRaises(SecurityError):
+            self.validator.validate_query("DESCRIBE users", "mysql")
+        self.validator.read_only_mode = False
+        self.assertTrue(self.validator.validate_query("DESCRIBE users", "mysql"))
+        self.validator.read_only_mode = True
+        with self.assertRaises(SecurityError):
+            self.validator.validate_query("DESCRIBE users", "mysql")
+
 
 class TestIdentifierManager(unittest.TestCase):
     """식별자 관리자 테스트"""
@@ -193,6 +279,64 @@ class TestIdentifierManager(unittest.TestCase):
         }
         self.identifier_manager._cache_valid = True
         
+    def test_lazy_schema_loading(self):
+        """최초 검증 시 지연 로더로 스키마 캐시를 한 번만 로드"""
+        loads = []
+        
+        def loader():
+            loads.append(1)
+            manager._table_whitelist = {"users"}
+            manager._column_whitelist = {"users": {"id"}}
+            manager._cache_valid = True
+            
+        manager = IdentifierManager(self.validator, schema_loader=loader)
+        self.assertTrue(manager.validate_table_name("users"))
+        self.assertTrue(manager.validate_column_name("users", "id"))
+        self.assertEqual(len(loads), 1)
+        
+        # 로더가 없으면 기존처럼 명시적 로드 필요
+        with self.assertRaises(SecurityError) as context:
+            IdentifierManager(self.validator).validate_table_name("users")
+        self.assertEqual(context.exception.error_code, "SCHEMA_CACHE_NOT_LOADED")
+        
+    def test_whitelist_ttl_reload(self):
+        """화이트리스트 유효 시간이 지나면 지연 로더로 다시 로드"""
+        loaded_tables = [{"users"}]
+        
+        def loader():
+            manager._table_whitelist = set(loaded_tables[-1])
+            manager._cache_valid = True
+            
+        manager = IdentifierManager(self.validator, schema_loader=loader, cache_ttl=300)
+        self.assertTrue(manager.validate_table_name("users"))
+        
+        # 외부에서 새 테이블 생성 - 유효 시간 내에는 기존 화이트리스트 사용
+        loaded_tables.append({"users", "orders"})
+        with self.assertRaises(SecurityError):
+            manager.validate_table_name("orders")
+            
+        # 유효 시간 경과 후에는 재로딩되어 새 테이블 허용
+        manager._loaded_at -= 300
+        self.assertTrue(manager.validate_table_name("orders"))
+        
+    def test_partial_bulk_load_failure(self):
+        """외래키 일괄 로드가 실패해도 컬럼 화이트리스트는 유지하고, 컬럼 로드 실패는 캐시하지 않음"""
+        adapter = Mock()
+        adapter.get_tables.return_value = ["users"]
+        adapter.get_table_schema_bulk.return_value = {"users": [{"name": "id"}, {"name": "email"}]}
+        adapter.get_foreign_keys_bulk.side_effect = Exception("fk query failed")
+        
+        manager = IdentifierManager(self.validator)
+        manager.load_schema_cache(adapter)
+        self.assertTrue(manager.validate_column_name("users", "email"))
+        self.assertEqual(manager._schema_cache["users"]["foreign_keys"], [])
+        
+        adapter.get_table_schema_bulk.side_effect = Exception("schema query failed")
+        manager = IdentifierManager(self.validator)
+        with self.assertRaises(Exception):
+            manager.load_schema_cache(adapter)
+        self.assertFalse(manager.is_cache_valid())
+        
     def test_valid_table_names(self):
         """유효한 테이블명 테스트"""
         valid_tables = ["users", "orders", "products"]
@@ -242,6 +386,14 @@ class TestIdentifierManager(unittest.TestCase):
                     self.identifier_manager.validate_column_name(table, column)
                 self.assertIn("존재하지 않습니다", str(context.exception))
                 
+    def test_validate_column_names_bulk(self):
+        """컬럼명 일괄 검증 테스트"""
+        self.assertTrue(self.identifier_manager.validate_column_names("users", ["id", "name"]))
+        
+        with self.assertRaises(SecurityError) as context:
+            self.identifier_manager.validate_column_names("users", ["id", "password"])
+        self.assertEqual(context.exception.error_code, "COLUMN_NOT_WHITELISTED")
+                
     def test_dangerous_identifier_patterns(self):
         """위험한 식별자 패턴 테스트"""
         dangerous_identifiers = [
@@ -272,6 +424,10 @@ class TestIdentifierManager(unittest.TestCase):
         # PostgreSQL 큰따옴표
         postgresql_quoted = self.identifier_manager.get_safe_identifier("users", "postgresql")
         self.assertEqual(postgresql_quoted, '"users"')
+        
+        # 인용부호 문자 이스케이프
+        self.assertEqual(self.identifier_manager.get_safe_identifier("us`ers", "mysql"), "`us``ers`")
+        self.assertEqual(self.identifier_manager.get_safe_identifier('us"ers', "postgresql"), '"us""ers"')
 
 
 class TestSecurityIntegration(unittest.TestCase):
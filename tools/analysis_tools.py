@@ -2,46 +2,122 @@
 Analysis and performance-related MCP tools.
 """
 
+import json
 import logging
 
 logger = logging.getLogger(__name__)
 
+# 실행 계획 분석 결과별 최적화 제안 (제안 순서 유지)
+_PLAN_SUGGESTIONS = (
+    ("index", "정렬 작업이 발생하고 있습니다. ORDER BY 절에 사용된 컬럼에 대한 인덱스 추가를 고려하세요."),
+    ("full_scan", "전체 테이블 스캔이 발생하고 있습니다. WHERE 절에 사용된 컬럼에 대한 인덱스 추가를 고려하세요."),
+    ("temporary", "임시 테이블이 사용되고 있습니다. GROUP BY나 ORDER BY 절의 최적화를 고려하세요."),
+    ("subquery", "서브쿼리가 사용되고 있습니다. JOIN으로 변경하는 것을 고려하세요."),
+)
+
+def _iter_plan_nodes(node):
+    """JSON 실행 계획의 모든 딕셔너리 노드를 순회"""
+    if isinstance(node, dict):
+        yield node
+        for value in node.values():
+            yield from _iter_plan_nodes(value)
+    elif isinstance(node, list):
+        for item in node:
+            yield from _iter_plan_nodes(item)
+
+def _detect_plan_issues(plan) -> set:
+    """실행 계획에서 정렬/전체 스캔/임시 테이블/서브쿼리 사용 여부 검출
+    
+    MySQL EXPLAIN FORMAT=JSON과 PostgreSQL EXPLAIN (FORMAT JSON)의 구조화된 필드를 확인하며,
+    JSON이 아닌 계획(EXPLAIN ANALYZE 트리 등)은 문자열 검색으로 판단합니다.
+    """
+    if isinstance(plan, str):
+        try:
+            plan = json.loads(plan)
+        except ValueError:
+            plan_str = plan.lower()
+            issues = set()
+            if "sort" in plan_str:
+                issues.add("index")
+            if "table scan" in plan_str or "seq scan" in plan_str:
+                issues.add("full_scan")
+            if "temporary" in plan_str:
+                issues.add("temporary")
+            if "subquery" in plan_str:
+                issues.add("subquery")
+            return issues
+            
+    issues = set()
+    for node in _iter_plan_nodes(plan):
+        node_type = node.get("Node Type")
+        
+        # MySQL: using_filesort, PostgreSQL: Sort 노드
+        if node.get("using_filesort") is True or node_type in ("Sort", "Incremental Sort"):
+            issues.add("index")
+        # MySQL: access_type ALL, PostgreSQL: Seq Scan 노드
+        if node.get("access_type") == "ALL" or node_type == "Seq Scan":
+            issues.add("full_scan")
+        # MySQL: using_temporary_table, PostgreSQL: 디스크 정렬/임시 블록 기록
+        if (node.get("using_temporary_table") is True or node.get("Sort Space Type") == "Disk"
+                or node.get("Temp Written Blocks", 0) > 0):
+            issues.add("temporary")
+        # MySQL: *_subqueries/materialized_from_subquery, PostgreSQL: Subquery Scan/SubPlan/InitPlan
+        if (node_type == "Subquery Scan" or node.get("Parent Relationship") in ("SubPlan", "InitPlan")
+                or any(key.endswith("subqueries") or key == "materialized_from_subquery" for key in node)):
+            issues.add("subquery")
+    return issues
+
 def register_analysis_tools(mcp, adapter):
     """분석 관련 도구들을 MCP 서버에 등록"""
     
     @mcp.tool()
-    def execute_query(query: str, params: list = None) -> dict:
+    def execute_query(query: str, params: list = None, max_rows: int = None) -> dict:
         """안전한 읽기 전용 쿼리를 실행합니다.
 
         Args:
             query: 실행할 SELECT 쿼리 (값은 반드시 %s 플레이스홀더 사용)
             params: 값 파라미터 (리스트/배열). 없으면 None
+            max_rows: 반환할 최대 행 수. 없으면 전체 결과 반환
         """
         try:
             # 1. 쿼리 검증
             adapter.validator.validate_query(query, adapter.get_db_type())
             
+            # 2. 최대 행 수 검증
+            if max_rows is not None and (not isinstance(max_rows, int) or max_rows < 1):
+                raise ValueError("max_rows 값은 1 이상의 정수여야 합니다.")
+            
             with adapter:
                 bound_params = tuple(params) if params is not None else None
-                result = adapter.execute_query(query, bound_params)
+                # 잘림 여부 확인을 위해 한 행을 더 가져옴
+                result = adapter.execute_query(query, bound_params, max_rows + 1 if max_rows else None)
+                truncated = max_rows is not None and len(result) > max_rows
+                if truncated:
+                    result = result[:max_rows]
                 return {
                     "columns": list(result[0].keys()) if result else [],
                     "data": result,
-                    "row_count": len(result)
+                    "row_count": len(result),
+                    "truncated": truncated
                 }
         except Exception as e:
             logger.error(f"쿼리 실행 실패: {str(e)}")
             raise
     
     @mcp.tool()
-    def explain_query(query: str) -> dict:
-        """쿼리의 실행 계획을 분석합니다."""
+    def explain_query(query: str, analyze: bool = False) -> dict:
+        """쿼리의 실행 계획을 분석합니다.
+
+        Args:
+            query: 분석할 SELECT 쿼리
+            analyze: True이면 쿼리를 실제 실행하여 행 수/소요 시간을 포함 (MySQL 8.0.18+)
+        """
         try:
             # 1. 쿼리 검증
             adapter.validator.validate_query(query, adapter.get_db_type())
             
             with adapter:
-                return adapter.explain_query(query)
+                return adapter.explain_query(query, analyze)
         except Exception as e:
             logger.error(f"쿼리 실행 계획 분석 실패: {str(e)}")
             raise
@@ -57,41 +133,20 @@ def register_analysis_tools(mcp, adapter):
                 # 현재 쿼리의 실행 계획 분석
                 current_plan = adapter.explain_query(query)
                 
-                # 사용된 테이블들의 인덱스 정보
+                # 사용된 테이블들의 인덱스 정보 (일괄 조회)
                 tables = adapter.get_tables()
-                table_indexes = {}
-                for table in tables:
-                    table_indexes[table] = adapter.get_indexes(table)
-                
-                # 최적화 제안 생성
-                suggestions = []
-                
-                # 실행 계획 기반 제안 (DB 타입별로 다름)
-                plan_str = str(current_plan).lower()
-                
-                if "filesort" in plan_str or "sort" in plan_str:
-                    suggestions.append({
-                        "type": "index",
-                        "message": "정렬 작업이 발생하고 있습니다. ORDER BY 절에 사용된 컬럼에 대한 인덱스 추가를 고려하세요."
-                    })
-                
-                if "full" in plan_str and "scan" in plan_str:
-                    suggestions.append({
-                        "type": "full_scan",
-                        "message": "전체 테이블 스캔이 발생하고 있습니다. WHERE 절에 사용된 컬럼에 대한 인덱스 추가를 고려하세요."
-                    })
-                
-                if "temporary" in plan_str or "temp" in plan_str:
-                    suggestions.append({
-                        "type": "temporary",
-                        "message": "임시 테이블이 사용되고 있습니다. GROUP BY나 ORDER BY 절의 최적화를 고려하세요."
-                    })
+                table_indexes = {
+                    table: {table: indexes}
+                    for table, indexes in adapter.get_indexes_bulk(tables).items()
+                }
                 
-                if "subquery" in plan_str or "nested" in plan_str:
-                    suggestions.append({
-                        "type": "subquery",
-                        "message": "서브쿼리가 사용되고 있습니다. JOIN으로 변경하는 것을 고려하세요."
-                    })
+                # 최적화 제안 생성 - 실행 계획 기반 제안 (구조화된 계획 필드 확인)
+                issues = _detect_plan_issues(current_plan.get("explain_plan"))
+                suggestions = [
+                    {"type": issue_type, "message": message}
+                    for issue_type, message in _PLAN_SUGGESTIONS
+                    if issue_type in issues
+                ]
                 
                 return {
                     "current_plan": current_plan,
@@ -102,11 +157,15 @@ def register_analysis_tools(mcp, adapter):
             raise
     
     @mcp.tool()
-    def get_db_status() -> dict:
-        """데이터베이스의 현재 상태 정보를 반환합니다."""
+    def get_db_status(include_processes: bool = False) -> dict:
+        """데이터베이스의 현재 상태 정보를 반환합니다.
+
+        Args:
+            include_processes: 프로세스 목록 포함 여부 (기본값: False)
+        """
         try:
             with adapter:
-                return adapter.get_db_status()
+                return adapter.get_db_status(include_processes)
         except Exception as e:
             raise
     
@@ -118,8 +177,10 @@ def register_analysis_tools(mcp, adapter):
                 tables = adapter.get_tables()
                 result = {}
                 
+                # 전체 테이블 크기는 테이블별 조회 대신 일괄 조회
+                table_sizes = adapter.get_table_sizes_bulk(tables)
                 for table in tables:
-                    size_info = adapter.get_table_size(table)
+                    size_info = table_sizes.get(table)
                     if size_info:
                         result[table] = size_info
                 
@@ -145,9 +206,10 @@ def register_analysis_tools(mcp, adapter):
                 tables = adapter.get_tables()
                 bottlenecks = []
                 
-                # 각 테이블의 크기와 인덱스 분석
+                # 각 테이블의 크기와 인덱스 분석 (크기 정보는 일괄 조회)
+                table_sizes = adapter.get_table_sizes_bulk(tables)
                 for table in tables:
-                    size_info = adapter.get_table_size(table)
+                    size_info = table_sizes.get(table)
                     if size_info:
                         rows = size_info.get("rows", 0)
                         data_size = size_info.get("data_size_mb", 0) * 1024 * 1024
@@ -212,28 +274,37 @@ def register_analysis_tools(mcp, adapter):
                     tables = adapter.get_tables()
                     
                 suggestions = {}
+                # 외래키/인덱스만 필요하므로 컬럼 스키마는 조회하지 않음
+                table_foreign_keys = adapter.get_foreign_keys_bulk(tables)
+                table_indexes = adapter.get_indexes_bulk(tables)
+                db_type = adapter.get_db_type()
+                quote = adapter.identifier_manager.get_safe_identifier
                 
                 for table in tables:
                     # 외래키 확인
-                    foreign_keys = adapter.get_foreign_keys(table)
+                    foreign_keys = table_foreign_keys.get(table, [])
                     
                     # 기존 인덱스 확인
-                    existing_indexes = adapter.get_indexes(table).get(table, {})
-                    existing_columns = set()
-                    for index_info in existing_indexes.values():
-                        for col_info in index_info.get("columns", []):
-                            existing_columns.add(col_info["name"])
+                    existing_indexes = table_indexes.get(table, {})
+                    existing_columns = {
+                        col_info["name"]
+                        for index_info in existing_indexes.values()
+                        for col_info in index_info.get("columns", ())
+                    }
                     
                     table_suggestions = []
                     
-                    # 외래키에 대한 인덱스 제안
+                    # 외래키에 대한 인덱스 제안 (테이블명은 테이블당 한 번만 인용 처리)
+                    quoted_table = quote(table, db_type)
                     for fk in foreign_keys:
-                        if fk["column"] not in existing_columns:
+                        column = fk["column"]
+                        if column not in existing_columns:
+                            index_name = quote(f"idx_{table}_{column}", db_type)
                             table_suggestions.append({
                                 "type": "foreign_key",
-                                "column": fk["column"],
+                                "column": column,
                                 "reason": "외래키 컬럼에 대한 인덱스가 없습니다.",
-                                "suggestion": f"CREATE INDEX idx_{table}_{fk['column']} ON {table} ({fk['column']});"
+                                "suggestion": f"CREATE INDEX {index_name} ON {quoted_table} ({quote(column, db_type)});"
                             })
                     
                     if table_suggestions:
@@ -258,8 +329,10 @@ def register_analysis_tools(mcp, adapter):
                 tables = adapter.get_tables()
                 optimization_suggestions = {}
                 
+                # 크기 정보는 일괄 조회
+                table_sizes = adapter.get_table_sizes_bulk(tables)
                 for table in tables:
-                    size_info = adapter.get_table_size(table)
+                    size_info = table_sizes.get(table)
                     table_suggestions = []
                     
                     if size_info:
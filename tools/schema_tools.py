@@ -10,19 +10,33 @@ def register_schema_tools(mcp, adapter):
     """스키마 관련 도구들을 MCP 서버에 등록"""
     
     @mcp.tool()
-    def get_schema() -> dict:
-        """데이터베이스 스키마를 반환합니다."""
+    def get_schema(tables: list = None) -> dict:
+        """데이터베이스 스키마를 반환합니다.
+
+        Args:
+            tables: 조회할 테이블명 목록. 없으면 전체 테이블
+        """
         try:
+            # 1. 테이블명 검증 (제공된 경우, 중복 제거)
+            if tables:
+                tables = list(dict.fromkeys(tables))
+                for table in tables:
+                    adapter.identifier_manager.validate_table_name(table)
+            
             with adapter:
-                tables = adapter.get_tables()
+                if not tables:
+                    tables = adapter.get_tables()
                 schema = {}
                 
+                # 컬럼/외래키 정보는 테이블별 조회 대신 일괄 조회
+                table_schemas = adapter.get_table_schema_bulk(tables)
+                table_foreign_keys = adapter.get_foreign_keys_bulk(tables)
+                
                 for table in tables:
-                    columns = adapter.get_table_schema(table)
-                    schema[table] = {"columns": columns}
+                    schema[table] = {"columns": table_schemas.get(table, [])}
                     
                     # 외래키 정보 추가
-                    foreign_keys = adapter.get_foreign_keys(table)
+                    foreign_keys = table_foreign_keys.get(table)
                     if foreign_keys:
                         schema[table]["foreign_keys"] = foreign_keys
                 
@@ -31,14 +45,19 @@ def register_schema_tools(mcp, adapter):
             raise
     
     @mcp.tool()
-    def get_table_stats(table_name: str) -> dict:
-        """테이블의 기본 통계 정보를 반환합니다."""
+    def get_table_stats(table_name: str, stats_mode: str = "auto") -> dict:
+        """테이블의 기본 통계 정보를 반환합니다.
+
+        Args:
+            table_name: 테이블명
+            stats_mode: "auto"(대용량 테이블만 근사), "exact"(정확한 값), "approx"(근사치)
+        """
         try:
             # 1. 테이블명 검증
             adapter.identifier_manager.validate_table_name(table_name)
             
             with adapter:
-                return adapter.get_table_stats(table_name)
+                return adapter.get_table_stats(table_name, stats_mode)
         except Exception as e:
             logger.error(f"테이블 통계 조회 실패: {str(e)}")
             raise
@@ -64,34 +83,43 @@ def register_schema_tools(mcp, adapter):
     def get_column_stats(table_name: str, column_name: str) -> dict:
         """특정 컬럼의 상세 통계 정보를 반환합니다."""
         try:
-            # 1. 테이블명과 컬럼명 검증
-            adapter.identifier_manager.validate_table_name(table_name)
+            # 1. 테이블명과 컬럼명 검증 (validate_column_name이 테이블명도 함께 검증)
             adapter.identifier_manager.validate_column_name(table_name, column_name)
             
             with adapter:
-                # 컬럼별 상세 통계는 어댑터에서 구현하거나 여기서 처리
-                # 우선 기본 통계에서 해당 컬럼만 추출
-                table_stats = adapter.get_table_stats(table_name)
+                # 해당 컬럼만 집계 (전체 컬럼 통계를 계산하지 않음)
+                table_stats = adapter.get_table_stats(table_name, columns=[column_name])
                 
                 if column_name in table_stats.get("column_stats", {}):
                     col_stats = table_stats["column_stats"][column_name]
                     
-                    # 컬럼 타입 정보 추가
+                    # 컬럼 타입 정보 추가 (캐시된 스키마 사용)
                     schema = adapter.get_table_schema(table_name)
-                    col_type = None
-                    for col in schema:
-                        if col["name"] == column_name:
-                            col_type = col["type"]
-                            break
+                    col_type = next((col["type"] for col in schema if col["name"] == column_name), None)
                     
                     return {
                         "table_name": table_name,
                         "column_name": column_name,
                         "column_type": col_type,
+                        "total_rows": table_stats.get("total_rows"),
                         "stats": col_stats
                     }
                 else:
                     raise ValueError(f"컬럼 '{column_name}'이 테이블 '{table_name}'에 존재하지 않습니다.")
         except Exception as e:
             logger.error(f"컬럼 통계 조회 실패: {str(e)}")
-            raise 
\ No newline at end of file
+            raise 
+    
+    @mcp.tool()
+    def refresh_schema_cache() -> dict:
+        """스키마/메타데이터 캐시를 비우고 다시 로드합니다 (DDL 변경 후 사용)."""
+        try:
+            with adapter:
+                adapter.refresh_schema_cache()
+                return {
+                    "refreshed": True,
+                    "table_count": len(adapter.identifier_manager.get_available_tables())
+                }
+        except Exception as e:
+            logger.error(f"스키마 캐시 새로고침 실패: {str(e)}")
+            raise
\ No newline at end of file
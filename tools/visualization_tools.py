@@ -2,6 +2,17 @@
 Visualization-related MCP tools.
 """
 
+import heapq
+from operator import itemgetter
+
+# ASCII 막대 차트 너비와 미리 만들어 둔 막대 문자열 (행마다 잘라서 사용)
+_BAR_WIDTH = 30
+_BAR_FILLED = "█" * _BAR_WIDTH
+_BAR_EMPTY = "░" * _BAR_WIDTH
+
+# ERD 컬럼 키 타입별 표시
+_KEY_INDICATORS = {"PRI": " PK", "UNI": " UK", "MUL": " FK"}
+
 def register_visualization_tools(mcp, adapter):
     """시각화 관련 도구들을 MCP 서버에 등록"""
     
@@ -15,9 +26,12 @@ def register_visualization_tools(mcp, adapter):
                 # Mermaid ERD 문법 시작
                 mermaid_lines = ["erDiagram"]
                 
-                # 각 테이블의 컬럼 정보 수집
+                # 각 테이블의 컬럼/외래키 정보 일괄 수집
+                table_schemas = adapter.get_table_schema_bulk(tables)
+                table_foreign_keys = adapter.get_foreign_keys_bulk(tables)
+                
                 for table in tables:
-                    columns = adapter.get_table_schema(table)
+                    columns = table_schemas.get(table, [])
                     
                     # 테이블 정의 추가
                     mermaid_lines.append(f"    {table} {{")
@@ -25,20 +39,12 @@ def register_visualization_tools(mcp, adapter):
                     for col in columns:
                         field_name = col["name"]
                         field_type = col["type"]
-                        is_nullable = col["nullable"]
-                        key_type = col["key"]
                         
                         # 키 타입에 따른 표시
-                        key_indicator = ""
-                        if key_type == "PRI":
-                            key_indicator = " PK"
-                        elif key_type == "UNI":
-                            key_indicator = " UK"
-                        elif key_type == "MUL":
-                            key_indicator = " FK"
+                        key_indicator = _KEY_INDICATORS.get(col["key"], "")
                         
                         # NULL 여부
-                        null_indicator = "" if is_nullable else " NOT NULL"
+                        null_indicator = "" if col["nullable"] else " NOT NULL"
                         
                         mermaid_lines.append(f"        {field_type} {field_name}{key_indicator}{null_indicator}")
                     
@@ -46,7 +52,7 @@ def register_visualization_tools(mcp, adapter):
                 
                 # 외래키 관계 추가
                 for table in tables:
-                    foreign_keys = adapter.get_foreign_keys(table)
+                    foreign_keys = table_foreign_keys.get(table, [])
                     for fk in foreign_keys:
                         ref_table = fk["referenced_table"]
                         # Mermaid 관계 문법: 테이블1 ||--o{ 테이블2 : 관계명
@@ -78,20 +84,24 @@ def register_visualization_tools(mcp, adapter):
                 ]
                 
                 total_rows = 0
-                total_data_size = 0
-                total_index_size = 0
+                total_data_size_mb = 0
+                total_index_size_mb = 0
                 tables_data = []
                 
+                # 컬럼 수 계산용 스키마와 테이블 크기 정보 일괄 조회
+                table_schemas = adapter.get_table_schema_bulk(tables)
+                table_sizes = adapter.get_table_sizes_bulk(tables)
+                
                 for table in tables:
                     # 테이블 크기 정보
-                    size_info = adapter.get_table_size(table)
+                    size_info = table_sizes.get(table, {})
                     rows = size_info.get("rows", 0)
                     data_size_mb = size_info.get("data_size_mb", 0)
                     index_size_mb = size_info.get("index_size_mb", 0)
                     total_size_mb = size_info.get("total_size_mb", 0)
                     
                     # 컬럼 수
-                    schema = adapter.get_table_schema(table)
+                    schema = table_schemas.get(table, [])
                     col_count = len(schema)
                     
                     # 행 수 포맷팅
@@ -102,15 +112,15 @@ def register_visualization_tools(mcp, adapter):
                         f"| `{table}` | {rows_formatted} | {col_count} | {data_size_mb}MB | {index_size_mb}MB | {total_size_mb}MB |  |"
                     )
                     
-                    # 총계 계산 (MB를 바이트로 변환)
+                    # 총계 계산 (MB 단위 그대로 합산)
                     total_rows += rows
-                    total_data_size += data_size_mb * 1024 * 1024
-                    total_index_size += index_size_mb * 1024 * 1024
+                    total_data_size_mb += data_size_mb
+                    total_index_size_mb += index_size_mb
                     
                     tables_data.append((table, rows, data_size_mb, index_size_mb, total_size_mb))
                 
                 # 정렬 (행 수 기준 내림차순)
-                tables_data.sort(key=lambda x: x[1], reverse=True)
+                tables_data.sort(key=itemgetter(1), reverse=True)
                 
                 # 요약 통계 추가
                 markdown_lines.extend([
@@ -119,9 +129,9 @@ def register_visualization_tools(mcp, adapter):
                     "",
                     f"- **총 테이블 수**: {len(tables)}개",
                     f"- **총 행 수**: {total_rows:,}개",
-                    f"- **총 데이터 크기**: {round(total_data_size / (1024 * 1024), 2)}MB",
-                    f"- **총 인덱스 크기**: {round(total_index_size / (1024 * 1024), 2)}MB",
-                    f"- **총 데이터베이스 크기**: {round((total_data_size + total_index_size) / (1024 * 1024), 2)}MB"
+                    f"- **총 데이터 크기**: {round(total_data_size_mb, 2)}MB",
+                    f"- **총 인덱스 크기**: {round(total_index_size_mb, 2)}MB",
+                    f"- **총 데이터베이스 크기**: {round(total_data_size_mb + total_index_size_mb, 2)}MB"
                 ])
                 
                 # 상위 5개 테이블 (행 수 기준)
@@ -142,22 +152,35 @@ def register_visualization_tools(mcp, adapter):
                     "markdown_summary": markdown_summary,
                     "tables_count": len(tables),
                     "total_rows": total_rows,
-                    "total_size_mb": round((total_data_size + total_index_size) / (1024 * 1024), 2)
+                    "total_size_mb": round(total_data_size_mb + total_index_size_mb, 2)
                 }
         except Exception as e:
             raise
     
     @mcp.tool()
-    def generate_performance_report() -> dict:
-        """성능 분석을 시각적 차트와 함께 리포트로 생성합니다."""
+    def generate_performance_report(include_indexes: bool = True) -> dict:
+        """성능 분석을 시각적 차트와 함께 리포트로 생성합니다.
+
+        Args:
+            include_indexes: 인덱스 효율성 분석 포함 여부 (기본값: True)
+        """
         try:
             with adapter:
                 tables = adapter.get_tables()
                 
-                # 테이블 크기 정보 수집
+                # 분석할 테이블이 없으면 추가 조회 없이 바로 반환
+                if not tables:
+                    return {
+                        "performance_report": "# 📊 데이터베이스 성능 분석 리포트\n\n분석할 테이블이 없습니다.",
+                        "analyzed_tables": 0,
+                        "top_table_size_mb": 0
+                    }
+                
+                # 테이블 크기 정보 수집 (일괄 조회)
                 size_data = []
+                table_sizes = adapter.get_table_sizes_bulk(tables)
                 for table in tables:
-                    size_info = adapter.get_table_size(table)
+                    size_info = table_sizes.get(table)
                     if size_info:
                         rows = size_info.get("rows", 0)
                         data_size = size_info.get("data_size_mb", 0)
@@ -165,26 +188,28 @@ def register_visualization_tools(mcp, adapter):
                         total_size = data_size + index_size
                         size_data.append((table, rows, data_size, index_size, total_size))
                 
-                # 크기순 정렬
-                size_data.sort(key=lambda x: x[4], reverse=True)
-                top_10_tables = size_data[:10]
+                # 크기순 상위 10개만 선택 (전체 정렬 없이)
+                top_10_tables = heapq.nlargest(10, size_data, key=itemgetter(4))
                 
-                # 인덱스 효율성 분석
+                # 인덱스 효율성 분석 (요청된 경우에만 인덱스 정보 조회)
                 index_data = []
-                all_indexes = adapter.get_indexes()
+                all_indexes = adapter.get_indexes() if include_indexes else {}
                 for table_name, indexes in all_indexes.items():
                     index_count = len(indexes)
-                    cardinalities = []
+                    # 카디널리티 평균은 중간 리스트 없이 합계/개수로 한 번에 누적
+                    cardinality_sum = 0
+                    cardinality_count = 0
                     for index_info in indexes.values():
                         cardinality = index_info.get("cardinality", 0)
                         if cardinality > 0:
-                            cardinalities.append(cardinality)
+                            cardinality_sum += cardinality
+                            cardinality_count += 1
                     
-                    avg_cardinality = sum(cardinalities) / len(cardinalities) if cardinalities else 0
+                    avg_cardinality = cardinality_sum / cardinality_count if cardinality_count else 0
                     index_data.append((table_name, index_count, avg_cardinality))
                 
                 # 평균 카디널리티순 정렬
-                index_data.sort(key=lambda x: x[2], reverse=True)
+                index_data.sort(key=itemgetter(2), reverse=True)
                 
                 # 마크다운 리포트 생성
                 report_lines = [
@@ -199,25 +224,30 @@ def register_visualization_tools(mcp, adapter):
                 
                 # ASCII 차트 생성
                 if top_10_tables:
-                    max_size = max(row[4] for row in top_10_tables) if top_10_tables else 1
+                    # 내림차순이므로 첫 행이 최대 크기 (0 이하이면 모든 막대를 비움)
+                    max_size = top_10_tables[0][4]
+                    if max_size <= 0:
+                        max_size = float("inf")
                     for table_name, rows, data_size, index_size, total_size in top_10_tables:
-                        bar_length = int((total_size / max_size) * 30) if max_size > 0 else 0
-                        bar = "█" * bar_length + "░" * (30 - bar_length)
+                        bar_length = int(total_size / max_size * _BAR_WIDTH)
+                        bar = _BAR_FILLED[:bar_length] + _BAR_EMPTY[bar_length:]
                         report_lines.append(f"{table_name:<20} |{bar}| {total_size:.2f}MB")
                 
-                report_lines.extend([
-                    "```",
-                    "",
-                    "## 🔍 인덱스 효율성 분석",
-                    "",
-                    "| 테이블명 | 인덱스 수 | 평균 카디널리티 | 효율성 |",
-                    "|---------|-----------|-----------------|--------|"
-                ])
+                report_lines.append("```")
                 
                 # 인덱스 효율성 테이블
-                for table_name, index_count, avg_cardinality in index_data:
-                    efficiency = "🟢 좋음" if avg_cardinality > 100 else "🟡 보통" if avg_cardinality > 10 else "🔴 나쁨"
-                    report_lines.append(f"| `{table_name}` | {index_count} | {avg_cardinality:.1f} | {efficiency} |")
+                if include_indexes:
+                    report_lines.extend([
+                        "",
+                        "## 🔍 인덱스 효율성 분석",
+                        "",
+                        "| 테이블명 | 인덱스 수 | 평균 카디널리티 | 효율성 |",
+                        "|---------|-----------|-----------------|--------|"
+                    ])
+                    
+                    for table_name, index_count, avg_cardinality in index_data:
+                        efficiency = "🟢 좋음" if avg_cardinality > 100 else "🟡 보통" if avg_cardinality > 10 else "🔴 나쁨"
+                        report_lines.append(f"| `{table_name}` | {index_count} | {avg_cardinality:.1f} | {efficiency} |")
                 
                 # Mermaid 차트도 추가
                 report_lines.extend([